@@ -30,6 +30,7 @@ from PyQt5.QtWidgets import (
 import matplotlib as mpl
 from matplotlib.widgets import AxesWidget
 import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure as MplFigure
 from matplotlib.patches import Rectangle
 from matplotlib.transforms import ScaledTranslation
@@ -193,10 +194,16 @@ class WLCalc(QWidget, SaveFileMixin):
                                   zorder=15, marker='None', linestyle='--')
 
         # Rain.
-        self.h_rain, = ax1.plot([], [])
+        self.h_rain = ax1.add_collection(
+            PolyCollection([], facecolor=[23/255, 52/255, 88/255],
+                           zorder=100, alpha=0.65, lw=0),
+            autolim=False)
 
         # Precipitation.
-        self.h_ptot, = ax1.plot([], [])
+        self.h_ptot = ax1.add_collection(
+            PolyCollection([], facecolor=[165/255, 165/255, 165/255],
+                           zorder=50, alpha=0.65, lw=0),
+            autolim=False)
 
         # Evapotranspiration.
         self.h_etp, = ax1.plot([], [], color='#FF6666', lw=1.5, zorder=500,
@@ -212,7 +219,10 @@ class WLCalc(QWidget, SaveFileMixin):
             fill=True, alpha=0.15, visible=False)
 
         # Predicted GLUE water levels
-        self.glue_plt, = ax0.plot([], [])
+        self.glue_plt = ax0.add_collection(
+            PolyCollection([], facecolor='0.85', lw=1, edgecolor='0.65',
+                           zorder=0),
+            autolim=False)
 
         # Rectangular selection box.
         self._rect_selection = [(None, None), (None, None)]
@@ -931,20 +941,26 @@ class WLCalc(QWidget, SaveFileMixin):
         self._mrc_period_memory = [[], ]
         self.btn_undo.setEnabled(False)
 
-        self.clear_selected_wl()
+        self.clear_selected_wl(draw=False)
         self._update_edit_toolbar_state()
 
-        # Plot observed and predicted water levels
-        self._draw_obs_wl()
-        self.draw_meas_wl()
-        self.draw_glue_wl()
-        self.draw_weather()
+        # Plot observed and predicted water levels. The canvas is drawn
+        # only once, after all the artists and axes have been updated.
+        self._draw_obs_wl(draw=False)
+        self._draw_meas_wl()
+        self._draw_glue_wl()
+        self._draw_weather()
 
-        self.setup_axis_range()
+        self._setup_axis_range()
         self.setup_xticklabels_format()
         self.draw()
 
     def setup_axis_range(self, event=None):
+        """Setup the range of the x- and y-axis and draw the canvas."""
+        self._setup_axis_range()
+        self.draw()
+
+    def _setup_axis_range(self):
         """Setup the range of the x- and y-axis."""
         if self.wldset is not None:
             y = self.water_lvl
@@ -967,9 +983,13 @@ class WLCalc(QWidget, SaveFileMixin):
 
         # Setup the yaxis range for the weather.
         self.fig.axes[1].axis(ymin=500, ymax=0)
-        self.draw()
 
     def setup_ax_margins(self, event=None):
+        """Setup the margins width of the axes and draw the canvas."""
+        self._setup_ax_margins()
+        self.draw()
+
+    def _setup_ax_margins(self):
         """Setup the margins width of the axes in inches."""
         fheight = self.fig.get_figheight()
         fwidth = self.fig.get_figwidth()
@@ -987,7 +1007,6 @@ class WLCalc(QWidget, SaveFileMixin):
 
         for axe in self.fig.axes:
             axe.set_position([x0, y0, w, h])
-        self.draw()
 
     def setup_xticklabels_format(self):
         """Setup the format of the xticklabels."""
@@ -1030,11 +1049,12 @@ class WLCalc(QWidget, SaveFileMixin):
         elif self.dformat == 0:
             ax0.set_xlim(xlim[0] - self.dt4xls2mpl, xlim[1] - self.dt4xls2mpl)
 
-        self._draw_obs_wl()
-        self.draw_meas_wl()
-        self.draw_mrc()
-        self.draw_weather()
-        self.draw_glue_wl()
+        self._draw_obs_wl(draw=False)
+        self._draw_meas_wl()
+        self._draw_mrc_wl()
+        self._draw_mrc_periods()
+        self._draw_weather()
+        self._draw_glue_wl()
         self.draw()
 
     def setup_wl_style(self):
@@ -1068,6 +1088,14 @@ class WLCalc(QWidget, SaveFileMixin):
             widget.restore()
 
     def draw_meas_wl(self):
+        """
+        Draw the water level measured manually in the well and draw
+        the canvas.
+        """
+        self._draw_meas_wl()
+        self.draw()
+
+    def _draw_meas_wl(self):
         """Draw the water level measured manually in the well."""
         if self.wldset is not None and self.btn_show_meas_wl.value():
             time_wl_meas, wl_meas = self.wldset.get_wlmeas()
@@ -1079,7 +1107,6 @@ class WLCalc(QWidget, SaveFileMixin):
                 self._meas_wl_plt.set_visible(False)
         else:
             self._meas_wl_plt.set_visible(False)
-        self.draw()
 
     def draw_select_wl(self, draw=True):
         """Draw the selected water level data points."""
@@ -1093,27 +1120,48 @@ class WLCalc(QWidget, SaveFileMixin):
             self.draw()
 
     def draw_glue_wl(self):
+        """
+        Draw or hide the water level envelope estimated with GLUE and draw
+        the canvas.
+        """
+        self._draw_glue_wl()
+        self.draw()
+
+    def _draw_glue_wl(self):
         """Draw or hide the water level envelope estimated with GLUE."""
         if self.wldset is not None and self.btn_show_glue.value():
             gluedf = self.wldset.get_glue_at(-1)
             if gluedf is not None:
                 self.glue_plt.set_visible(True)
-                xlstime = (gluedf['water levels']['time'] +
-                           self.dt4xls2mpl * self.dformat)
-                wl05 = gluedf['water levels']['predicted'][:, 0]/1000
-                wl95 = gluedf['water levels']['predicted'][:, 2]/1000
-
-                self.glue_plt.remove()
-                self.glue_plt = self.fig.axes[0].fill_between(
-                    xlstime, wl95, wl05, facecolor='0.85', lw=1,
-                    edgecolor='0.65', zorder=0)
+                xlstime = gluedf['water levels']['time']
+                wlpred = gluedf['water levels']['predicted']
+
+                # The vertices of the envelope are updated in place instead
+                # of creating a new collection with fill_between each time.
+                # The polygon is made of the GLUE 95 water levels followed
+                # by the GLUE 05 water levels in reverse order. The dates
+                # and the mm to m conversion are applied once to the whole
+                # array of vertices.
+                n = len(xlstime)
+                verts = np.empty((2 * n, 2))
+                verts[:n, 0] = xlstime
+                verts[n:, 0] = xlstime[::-1]
+                verts[:n, 1] = wlpred[:, 2]
+                verts[n:, 1] = wlpred[::-1, 0]
+                verts[:, 0] += self.dt4xls2mpl * self.dformat
+                verts[:, 1] /= 1000
+                self.glue_plt.set_verts([verts])
             else:
                 self.glue_plt.set_visible(False)
         else:
             self.glue_plt.set_visible(False)
-        self.draw()
 
     def draw_weather(self):
+        """Plot the weather data and draw the canvas."""
+        self._draw_weather()
+        self.draw()
+
+    def _draw_weather(self):
         """Plot the weather data."""
         ax = self.fig.axes[1]
         if self.wxdset is None or self.btn_show_weather.value() is False:
@@ -1145,40 +1193,31 @@ class WLCalc(QWidget, SaveFileMixin):
             etp_bin = etp[:nbin*bw].reshape(nbin, bw)
             etp_bin = np.sum(etp_bin, axis=1)
 
-            # Generate the shapes for the fill_between
+            # Generate the shapes of the bars. The bars are drawn as the
+            # outline of a single polygon that starts and ends on the
+            # baseline, with four vertices per bar.
 
-            time_bar = np.zeros(len(time_bin) * 4)
-            rain_bar = np.zeros(len(rain_bin) * 4)
-            ptot_bar = np.zeros(len(ptot_bin) * 4)
+            rain_verts = np.zeros((len(time_bin) * 4, 2))
+            ptot_verts = np.zeros((len(time_bin) * 4, 2))
 
-            time_bar[0::4] = time_bin - (n * f)
-            time_bar[1::4] = time_bin - (n * f)
-            time_bar[2::4] = time_bin + (n * f)
-            time_bar[3::4] = time_bin + (n * f)
+            rain_verts[0::4, 0] = time_bin - (n * f)
+            rain_verts[1::4, 0] = time_bin - (n * f)
+            rain_verts[2::4, 0] = time_bin + (n * f)
+            rain_verts[3::4, 0] = time_bin + (n * f)
+            ptot_verts[:, 0] = rain_verts[:, 0]
 
-            rain_bar[0::4] = 0
-            rain_bar[1::4] = rain_bin
-            rain_bar[2::4] = rain_bin
-            rain_bar[3::4] = 0
+            rain_verts[1::4, 1] = rain_bin
+            rain_verts[2::4, 1] = rain_bin
 
-            ptot_bar[0::4] = 0
-            ptot_bar[1::4] = ptot_bin
-            ptot_bar[2::4] = ptot_bin
-            ptot_bar[3::4] = 0
+            ptot_verts[1::4, 1] = ptot_bin
+            ptot_verts[2::4, 1] = ptot_bin
 
             # Plot the data
 
-            self.h_rain.remove()
-            self.h_ptot.remove()
-
-            self.h_rain = ax.fill_between(
-                time_bar, 0, rain_bar, color=[23/255, 52/255, 88/255],
-                zorder=100, linestyle='None', alpha=0.65, lw=0)
-            self.h_ptot = ax.fill_between(
-                time_bar, 0, ptot_bar, color=[165/255, 165/255, 165/255],
-                zorder=50, linestyle='None', alpha=0.65, lw=0)
+            self.h_rain.set_verts([rain_verts] if nbin else [])
+            self.h_ptot.set_verts([ptot_verts] if nbin else [])
             self.h_etp.set_data(time_bin, etp_bin)
-        self.setup_ax_margins()
+        self._setup_ax_margins()
 
     def draw_mrc(self):
         """
@@ -1763,19 +1802,20 @@ def calc_synth_hydrograph(A, B, h, dt, ipeak):
 
     maxpeak = ipeak[:-1:2]
     minpeak = ipeak[1::2]
-    nsegmnt = len(minpeak)
 
-    hp = np.ones(len(h)) * np.nan
-    for i in range(nsegmnt):
-        hp[maxpeak[i]] = h[maxpeak[i]]
-        for j in range(minpeak[i] - maxpeak[i]):
-            imax = maxpeak[i]
-
-            LUMP1 = (1 - A*dt[imax+j]/2)
-            LUMP2 = B*dt[imax+j]
-            LUMP3 = (1 + A*dt[imax+j]/2)**-1
+    # The coefficients of the numerical scheme only depend on the time steps,
+    # so they are computed once for the whole series with numpy and the
+    # remaining recursive loop is done on native Python floats.
+    LUMP1 = (1 - A * dt / 2).tolist()
+    LUMP2 = (B * dt).tolist()
+    LUMP3 = ((1 + A * dt / 2)**-1).tolist()
 
-            hp[imax+j+1] = (LUMP1 * hp[imax+j] + LUMP2) * LUMP3
+    hp = np.ones(len(h)) * np.nan
+    for imax, imin in zip(maxpeak, minpeak):
+        hseg = [h[imax]]
+        for k in range(imax, imin):
+            hseg.append((LUMP1[k] * hseg[-1] + LUMP2[k]) * LUMP3[k])
+        hp[imax:imin + 1] = hseg
 
     return hp
 
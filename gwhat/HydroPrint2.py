@@ -7,6 +7,7 @@
 # Licensed under the terms of the GNU General Public License.
 
 # ---- Standard library imports
+from functools import lru_cache
 import io
 import sys
 import os
@@ -14,25 +15,24 @@ import os.path as osp
 
 # ---- Third party imports
 from PyQt5.QtGui import QImage
-from PyQt5.QtCore import Qt, QDate, QCoreApplication, QPoint
+from PyQt5.QtCore import Qt, QDate, QPoint, QSignalBlocker, QTimer
 from PyQt5.QtCore import pyqtSignal as QSignal
 from PyQt5.QtCore import pyqtSlot as QSlot
 from PyQt5.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QWidget, QDateEdit, QAbstractSpinBox,
     QGridLayout, QFrame, QMessageBox, QComboBox, QLabel, QTabWidget,
-    QFileDialog, QApplication, QPushButton, QDesktopWidget, QGroupBox,
+    QFileDialog, QApplication, QPushButton, QGroupBox,
     QMainWindow, QToolBar)
 
-from xlrd.xldate import xldate_from_date_tuple
-from xlrd import xldate_as_tuple
-
 # ---- Local imports
 from gwhat.config.ospath import (
     get_select_file_dialog_dir, set_select_file_dialog_dir)
 from gwhat.gwrecharge.glue import GLUEDataFrameBase
 from gwhat.hydrograph4 import Hydrograph
+from gwhat.utils.dates import qdate_from_xldate, xldate_from_qdate
 from gwhat.utils.icons import get_iconsize, get_icon
-from gwhat.utils.qthelpers import create_toolbutton
+from gwhat.utils.qthelpers import (
+    create_toolbutton, process_qt_events, FileSaver)
 from gwhat.common.utils import find_unique_filename
 from gwhat.projet.reader_waterlvl import load_waterlvl_measures
 from gwhat.widgets.buttons import LangToolButton
@@ -42,6 +42,15 @@ from gwhat.widgets.layout import OnOffToggleWidget, VSep
 import gwhat.widgets.mplfigureviewer as mplFigViewer
 
 
+@lru_cache(maxsize=1024)
+def xldate_from_year_month(year, month):
+    """
+    Return the numerical Excel date corresponding to the first day of
+    the specified month.
+    """
+    return xldate_from_qdate(QDate(year, month, 1))
+
+
 class HydroprintGUI(QWidget):
 
     ConsoleSignal = QSignal(str)
@@ -57,11 +66,26 @@ class HydroprintGUI(QWidget):
         self.dmngr.wxdsetChanged.connect(self.wxdset_changed)
 
         self.page_setup_win = PageSetupWin(self)
-        self.page_setup_win.newPageSetupSent.connect(self.layout_changed)
-
-        self.color_palette_win = ColorPreferencesDialog(parent)
-        self.color_palette_win.sig_color_preferences_changed.connect(
-            self.update_colors)
+        self.page_setup_win.newPageSetupSent.connect(self.page_setup_changed)
+
+        # The color palette dialog is only created the first time it is
+        # requested by the user, see the color_palette_win property.
+        self._color_palette_win = None
+
+        # Save the figure files in a separate thread.
+        self.figure_saver = FileSaver(self)
+        self.figure_saver.sig_save_error.connect(
+            self._handle_figure_save_error)
+
+        # Setup a timer to delay the update of the hydrograph when its layout
+        # is changed in the UI, so that a burst of changes results in a
+        # single update and rendering of the figure.
+        self._pending_layout_changes = []
+        self._pending_page_setup_changes = set()
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(150)
+        self._layout_timer.timeout.connect(self._apply_layout_changes)
 
         self.__initUI__()
 
@@ -133,7 +157,7 @@ class HydroprintGUI(QWidget):
             icon='color_picker',
             tip=("Show a window to setup the color palette "
                  "used to draw the hydrograph."),
-            triggered=self.color_palette_win.show
+            triggered=lambda: self.color_palette_win.show()
             )
         self.btn_language = LangToolButton()
         self.btn_language.setToolTip(
@@ -223,16 +247,6 @@ class HydroprintGUI(QWidget):
 
     def __init_scalesTabWidget__(self):
 
-        class QRowLayout(QGridLayout):
-            def __init__(self, items, parent=None):
-                super(QRowLayout, self).__init__(parent)
-
-                for col, item in enumerate(items):
-                    self.addWidget(item, 0, col)
-
-                self.setContentsMargins(0, 0, 0, 0)
-                self.setColumnStretch(0, 100)
-
         # ---- Time axis properties
 
         # Generate the widgets :
@@ -270,14 +284,15 @@ class HydroprintGUI(QWidget):
         widget_time_scale.setFrameStyle(0)
         grid_time_scale = QGridLayout()
 
-        GRID = [[QLabel('From :'), self.date_start_widget],
-                [QLabel('To :'), self.date_end_widget],
-                [QLabel('Scale :'), self.time_scale_label],
-                [QLabel('Date Disp. Pattern:'),
-                 self.dateDispFreq_spinBox]]
+        GRID = [('From :', self.date_start_widget),
+                ('To :', self.date_end_widget),
+                ('Scale :', self.time_scale_label),
+                ('Date Disp. Pattern:', self.dateDispFreq_spinBox)]
 
-        for i, ROW in enumerate(GRID):
-            grid_time_scale.addLayout(QRowLayout(ROW), i, 1)
+        for i, (label, widget) in enumerate(GRID):
+            grid_time_scale.addWidget(QLabel(label), i, 0)
+            grid_time_scale.addWidget(widget, i, 1)
+        grid_time_scale.setColumnStretch(0, 100)
 
         grid_time_scale.setVerticalSpacing(5)
         grid_time_scale.setContentsMargins(10, 10, 10, 10)
@@ -325,13 +340,15 @@ class HydroprintGUI(QWidget):
 
         subgrid_WLScale = QGridLayout()
 
-        GRID = [[QLabel('Minimum :'), self.waterlvl_max],
-                [QLabel('Scale :'), self.waterlvl_scale],
-                [QLabel('Grid Divisions :'), self.NZGridWL_spinBox],
-                [QLabel('Datum :'), self.datum_widget]]
+        GRID = [('Minimum :', self.waterlvl_max),
+                ('Scale :', self.waterlvl_scale),
+                ('Grid Divisions :', self.NZGridWL_spinBox),
+                ('Datum :', self.datum_widget)]
 
-        for i, ROW in enumerate(GRID):
-            subgrid_WLScale.addLayout(QRowLayout(ROW), i, 1)
+        for i, (label, widget) in enumerate(GRID):
+            subgrid_WLScale.addWidget(QLabel(label), i, 0)
+            subgrid_WLScale.addWidget(widget, i, 1)
+        subgrid_WLScale.setColumnStretch(0, 100)
 
         subgrid_WLScale.setVerticalSpacing(5)
         subgrid_WLScale.setContentsMargins(10, 10, 10, 10)  # (L, T, R, B)
@@ -362,11 +379,13 @@ class HydroprintGUI(QWidget):
 
         layout = QGridLayout()
 
-        GRID = [[QLabel('Precip. Scale :'), self.Ptot_scale],
-                [QLabel('Resampling :'), self.qweather_bin]]
+        GRID = [('Precip. Scale :', self.Ptot_scale),
+                ('Resampling :', self.qweather_bin)]
 
-        for i, row in enumerate(GRID):
-            layout.addLayout(QRowLayout(row), i, 1)
+        for i, (label, widget) in enumerate(GRID):
+            layout.addWidget(QLabel(label), i, 0)
+            layout.addWidget(widget, i, 1)
+        layout.setColumnStretch(0, 100)
 
         layout.setVerticalSpacing(5)
         layout.setContentsMargins(10, 10, 10, 10)  # (L,T,R,B)
@@ -390,23 +409,79 @@ class HydroprintGUI(QWidget):
 
     def close(self):
         """Close HydroPrint widget."""
-        self.color_palette_win.close()
+        self.figure_saver.wait()
+        if self._color_palette_win is not None:
+            self._color_palette_win.close()
         super().close()
 
     @property
-    def workdir(self):
-        return self.dmngr.workdir
+    def color_palette_win(self):
+        """
+        Return the dialog to setup the color palette of the hydrograph,
+        creating it the first time it is requested.
+        """
+        if self._color_palette_win is None:
+            self._color_palette_win = ColorPreferencesDialog(self.parent())
+            self._color_palette_win.sig_color_preferences_changed.connect(
+                self.update_colors)
+        return self._color_palette_win
 
     # ---- Utilities
     def save_figure(self, fname):
-        """Save the hydrograph figure in a file."""
-        self.hydrograph.generate_hydrograph()
-        self.hydrograph.savefig(fname)
+        """
+        Save the hydrograph figure in a file.
+
+        The hydrograph is generated, if it is not up to date, and rendered
+        in the main thread, because matplotlib cannot safely render text
+        from several threads at once. Only the rendered figure is written
+        to the file in a separate thread, so that the GUI does not freeze
+        while the file is written.
+        """
+        self._apply_layout_changes()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        if not self.hydrograph.isHydrographUpToDate:
+            self.hydrograph.generate_hydrograph()
+        buf = io.BytesIO()
+        try:
+            self.hydrograph.savefig(buf, format=osp.splitext(fname)[1][1:])
+        except Exception as error:
+            QApplication.restoreOverrideCursor()
+            self._show_figure_save_error(fname, str(error))
+            return
+        QApplication.restoreOverrideCursor()
+
+        data = buf.getvalue()
+
+        def write_figure(fname):
+            with open(fname, 'wb') as f:
+                f.write(data)
+        self.figure_saver.save(write_figure, fname)
+
+    @QSlot(str, object)
+    def _handle_figure_save_error(self, fname, error):
+        """Handle when the hydrograph figure could not be saved in a file."""
+        if isinstance(error, PermissionError):
+            msg = "The file is in use by another application or user."
+            QMessageBox.warning(self, 'Warning', msg, QMessageBox.Ok)
+            self.select_save_path()
+        else:
+            self._show_figure_save_error(fname, str(error))
+
+    def _show_figure_save_error(self, fname, error):
+        """
+        Show a message to warn that the hydrograph figure could not be saved
+        in the specified file because of the specified error.
+        """
+        msg = ("The hydrograph figure could not be saved in {} because of "
+               "the following error:<br><br>{}").format(fname, error)
+        QMessageBox.warning(self, 'Warning', msg, QMessageBox.Ok)
 
     def copyfig_to_clipboard(self):
         """Saves the current BRF figure to the clipboard."""
+        self._apply_layout_changes()
         buf = io.BytesIO()
-        self.hydrograph.generate_hydrograph()
+        if not self.hydrograph.isHydrographUpToDate:
+            self.hydrograph.generate_hydrograph()
         self.hydrograph.savefig(buf)
         QApplication.clipboard().setImage(QImage.fromData(buf.getvalue()))
         buf.close()
@@ -440,10 +515,8 @@ class HydroprintGUI(QWidget):
             self.hydrograph.gluedf = self.wldset.get_glue_at(-1)
 
         # Load the manual measurements.
-        fname = os.path.join(
-            osp.dirname(self.dmngr.projet.filename),
-            "Water Levels",
-            'waterlvl_manual_measurements')
+        fname = osp.join(
+            self.dmngr.projet.waterlvl_dirname, 'waterlvl_manual_measurements')
         tmeas, wlmeas = load_waterlvl_measures(fname, self.wldset['Well'])
         self.wldset.set_wlmeas(tmeas, wlmeas)
 
@@ -471,7 +544,6 @@ class HydroprintGUI(QWidget):
             self.clear_hydrograph()
         else:
             self.hydrograph.set_wxdset(self.wxdset)
-            QCoreApplication.processEvents()
             self.draw_hydrograph()
 
     # ---- Draw Hydrograph Handlers
@@ -511,89 +583,123 @@ class HydroprintGUI(QWidget):
     def layout_changed(self):
         """
         When an element of the graph layout is changed in the UI.
-        """
 
+        The update of the hydrograph and its rendering in the viewer are
+        delayed, so that rapid changes, for instance when scrolling through
+        the values of a spinbox, do not trigger an update for each value.
+        """
         if self.__updateUI is False:
             return
 
-        self.update_graph_layout_parameter()
-
-        if self.hydrograph.isHydrographExists is False:
-            return
-
         sender = self.sender()
+        if sender == self.datum_widget and self.wldset is not None:
+            # The minimum value of the water level axis is converted to the
+            # new datum right away, so that the value displayed in the UI
+            # is always consistent with the datum.
+            wlscale = self.waterlvl_scale.value()
+            yoffset = int(self.wldset['Elevation'] / wlscale) * wlscale
 
-        if sender == self.btn_language:
-            self.hydrograph.draw_ylabels()
-            self.hydrograph.setup_xticklabels()
-            self.hydrograph.setup_legend()
-        elif sender in [self.waterlvl_max, self.waterlvl_scale]:
-            self.hydrograph.setup_waterlvl_scale()
-            self.hydrograph.draw_ylabels()
-        elif sender == self.NZGridWL_spinBox:
-            self.hydrograph.setup_waterlvl_scale()
-            self.hydrograph.update_precip_scale()
-            self.hydrograph.draw_ylabels()
-        elif sender == self.Ptot_scale:
-            self.hydrograph.update_precip_scale()
-            self.hydrograph.draw_ylabels()
-        elif sender == self.datum_widget:
-            yoffset = int(self.wldset['Elevation']/self.hydrograph.WLscale)
-            yoffset *= self.hydrograph.WLscale
-
-            self.hydrograph.WLmin = (yoffset - self.hydrograph.WLmin)
+            # This is calculated so that trailing zeros in the altitude of the
+            # well is not carried to the y axis labels, so that they remain a
+            # int multiple of *WLscale*.
 
             self.waterlvl_max.blockSignals(True)
-            self.waterlvl_max.setValue(self.hydrograph.WLmin)
+            self.waterlvl_max.setValue(yoffset - self.waterlvl_max.value())
             self.waterlvl_max.blockSignals(False)
 
-            # This is calculated so that trailing zeros in the altitude of the
-            # well is not carried to the y axis labels, so that they remain a
-            # int multiple of *WLscale*.
+        self._queue_layout_change(sender)
 
-            self.hydrograph.setup_waterlvl_scale()
-            self.hydrograph.draw_waterlvl()
-            self.hydrograph.draw_ylabels()
-        elif sender in [self.date_start_widget, self.date_end_widget]:
-            self.hydrograph.set_time_scale()
-            self.hydrograph.draw_weather()
-            self.hydrograph.draw_figure_title()
-        elif sender == self.dateDispFreq_spinBox:
-            self.hydrograph.set_time_scale()
-            self.hydrograph.setup_xticklabels()
-        elif sender == self.page_setup_win:
-            self.hydrograph.update_fig_size()
-            # Implicitly call : set_margins()
-            #                   draw_ylabels()
-            #                   set_time_scale()
-            #                   draw_figure_title
-            self.hydrograph.draw_waterlvl()
-            self.hydrograph.setup_legend()
-        elif sender == self.qweather_bin:
-            self.hydrograph.resample_bin()
-            self.hydrograph.draw_weather()
-            self.hydrograph.draw_ylabels()
-        elif sender == self.time_scale_label:
-            self.hydrograph.set_time_scale()
-            self.hydrograph.draw_weather()
-        else:
-            print('No action for this widget yet.')
+    def page_setup_changed(self, settings):
+        """
+        When the page setup settings of the graph are applied, with settings
+        being the names of the settings that changed.
+        """
+        if self.__updateUI is False or not settings:
+            return
+        self._pending_page_setup_changes.update(settings)
+        self._queue_layout_change(self.page_setup_win)
 
-        # !!!! temporary fix until I can find a better solution !!!!
+    def _queue_layout_change(self, sender):
+        """
+        Queue the change of the graph layout that was made with the
+        specified widget and restart the timer to apply the changes.
+        """
+        if sender not in self._pending_layout_changes:
+            self._pending_layout_changes.append(sender)
+        self._layout_timer.start()
 
-#        sender.blockSignals(True)
-        if type(sender) in [QDoubleSpinBox, QSpinBox]:
-            sender.setReadOnly(True)
+    def _apply_layout_changes(self):
+        """
+        Apply the pending changes made to the graph layout in the UI to the
+        hydrograph and render it in the viewer.
+        """
+        self._layout_timer.stop()
+        senders = self._pending_layout_changes
+        self._pending_layout_changes = []
+        page_setup_changes = self._pending_page_setup_changes
+        self._pending_page_setup_changes = set()
+        if not senders:
+            return
 
-        for i in range(10):
-            QCoreApplication.processEvents()
-        self.hydrograph_scrollarea.load_mpl_figure(self.hydrograph)
-        for i in range(10):
-            QCoreApplication.processEvents()
+        self.update_graph_layout_parameter()
 
-        if type(sender) in [QDoubleSpinBox, QSpinBox]:
-            sender.setReadOnly(False)
-#        sender.blockSignals(False)
+        if self.hydrograph.isHydrographExists is False:
+            return
+
+        for sender in senders:
+            if sender == self.btn_language:
+                self.hydrograph.draw_ylabels()
+                self.hydrograph.setup_xticklabels()
+                self.hydrograph.setup_legend()
+            elif sender in [self.waterlvl_max, self.waterlvl_scale]:
+                self.hydrograph.setup_waterlvl_scale()
+                self.hydrograph.draw_ylabels()
+            elif sender == self.NZGridWL_spinBox:
+                self.hydrograph.setup_waterlvl_scale()
+                self.hydrograph.update_precip_scale()
+                self.hydrograph.draw_ylabels()
+            elif sender == self.Ptot_scale:
+                self.hydrograph.update_precip_scale()
+                self.hydrograph.draw_ylabels()
+            elif sender == self.datum_widget:
+                self.hydrograph.setup_waterlvl_scale()
+                self.hydrograph.draw_waterlvl()
+                self.hydrograph.draw_ylabels()
+            elif sender in [self.date_start_widget, self.date_end_widget]:
+                self.hydrograph.set_time_scale()
+                self.hydrograph.draw_waterlvl()
+                self.hydrograph.draw_weather()
+                self.hydrograph.draw_figure_title()
+            elif sender == self.dateDispFreq_spinBox:
+                self.hydrograph.set_time_scale()
+                self.hydrograph.setup_xticklabels()
+            elif sender == self.page_setup_win:
+                # Only the elements of the graph that depend on the
+                # settings that changed are updated.
+                if page_setup_changes & {'pageSize', 'va_ratio', 'isLegend',
+                                         'isGraphTitle', 'is_meteo_on'}:
+                    self.hydrograph.update_fig_size()
+                    # Implicitly call : set_margins()
+                    #                   draw_ylabels()
+                    #                   set_time_scale()
+                    #                   draw_figure_title
+                if 'isTrendLine' in page_setup_changes:
+                    self.hydrograph.draw_waterlvl()
+                if page_setup_changes & {'isLegend', 'isTrendLine',
+                                         'is_meteo_on'}:
+                    self.hydrograph.setup_legend()
+            elif sender == self.qweather_bin:
+                self.hydrograph.resample_bin()
+                self.hydrograph.draw_weather()
+                self.hydrograph.draw_ylabels()
+            elif sender == self.time_scale_label:
+                self.hydrograph.set_time_scale()
+                self.hydrograph.draw_waterlvl()
+                self.hydrograph.draw_weather()
+            else:
+                print('No action for this widget yet.')
+
+        self.hydrograph_scrollarea.load_mpl_figure(self.hydrograph)
 
     def update_graph_layout_parameter(self):
 
@@ -616,13 +722,10 @@ class HydroprintGUI(QWidget):
 
         self.hydrograph.datemode = self.time_scale_label.currentText()
 
-        year = self.date_start_widget.date().year()
-        month = self.date_start_widget.date().month()
-        self.hydrograph.TIMEmin = xldate_from_date_tuple((year, month, 1), 0)
-
-        year = self.date_end_widget.date().year()
-        month = self.date_end_widget.date().month()
-        self.hydrograph.TIMEmax = xldate_from_date_tuple((year, month, 1), 0)
+        self.hydrograph.TIMEmin = self.get_xldate_from_widget(
+            self.date_start_widget)
+        self.hydrograph.TIMEmax = self.get_xldate_from_widget(
+            self.date_end_widget)
 
         self.hydrograph.date_labels_pattern = self.dateDispFreq_spinBox.value()
 
@@ -644,6 +747,14 @@ class HydroprintGUI(QWidget):
 
         self.hydrograph.bwidth_indx = self.qweather_bin.currentIndex()
 
+    def get_xldate_from_widget(self, date_widget):
+        """
+        Return the numerical Excel date corresponding to the first day of
+        the month of the date displayed in the specified date widget.
+        """
+        date = date_widget.date()
+        return xldate_from_year_month(date.year(), date.month())
+
     def clear_hydrograph(self):
         """Clear the hydrograph figure to show only a blank canvas."""
         self.hydrograph.clf()
@@ -660,8 +771,7 @@ class HydroprintGUI(QWidget):
 
         # Generate and Display Graph :
 
-        for i in range(5):
-            QCoreApplication.processEvents()
+        process_qt_events()
 
         QApplication.setOverrideCursor(Qt.WaitCursor)
 
@@ -669,6 +779,11 @@ class HydroprintGUI(QWidget):
         self.hydrograph.set_wxdset(self.dmngr.get_current_wxdset())
         self.hydrograph.generate_hydrograph()
 
+        # The hydrograph was generated from the current state of the UI, so
+        # there is no need to apply the pending layout changes, if any.
+        self._layout_timer.stop()
+        self._pending_layout_changes = []
+        self._pending_page_setup_changes = set()
         self.hydrograph_scrollarea.load_mpl_figure(self.hydrograph)
 
         QApplication.restoreOverrideCursor()
@@ -692,13 +807,7 @@ class HydroprintGUI(QWidget):
             ftype = ftype.replace('*', '')
             fname = fname if fname.endswith(ftype) else fname + ftype
             set_select_file_dialog_dir(os.path.dirname(fname))
-
-            try:
-                self.save_figure(fname)
-            except PermissionError:
-                msg = "The file is in use by another application or user."
-                QMessageBox.warning(self, 'Warning', msg, QMessageBox.Ok)
-                self.select_save_path()
+            self.save_figure(fname)
 
     # ---- Graph Layout Handlers
     def load_layout_isClicked(self):
@@ -720,15 +829,18 @@ class HydroprintGUI(QWidget):
 
         self.__updateUI = False
 
-        # Scales :
+        # The signals of the layout widgets are blocked while their values
+        # are set, since the hydrograph is redrawn once at the end anyway.
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.date_start_widget, self.date_end_widget,
+            self.dateDispFreq_spinBox, self.waterlvl_scale, self.waterlvl_max,
+            self.NZGridWL_spinBox, self.Ptot_scale, self.datum_widget,
+            self.qweather_bin, self.time_scale_label, self.btn_language)]
 
-        date = layout['TIMEmin']
-        date = xldate_as_tuple(date, 0)
-        self.date_start_widget.setDate(QDate(date[0], date[1], date[2]))
+        # Scales :
 
-        date = layout['TIMEmax']
-        date = xldate_as_tuple(date, 0)
-        self.date_end_widget.setDate(QDate(date[0], date[1], date[2]))
+        self.date_start_widget.setDate(qdate_from_xldate(layout['TIMEmin']))
+        self.date_end_widget.setDate(qdate_from_xldate(layout['TIMEmax']))
 
         self.dateDispFreq_spinBox.setValue(layout['date_labels_pattern'])
 
@@ -746,7 +858,8 @@ class HydroprintGUI(QWidget):
 
         # ---- Language and colors
         self.btn_language.set_language(layout['language'])
-        self.color_palette_win.load_colors()
+        if self._color_palette_win is not None:
+            self._color_palette_win.load_colors()
 
         # ---- Page Setup
 
@@ -772,6 +885,9 @@ class HydroprintGUI(QWidget):
         self.page_setup_win.fheight.setValue(layout['fheight'])
         self.page_setup_win.va_ratio_spinBox.setValue(layout['va_ratio'])
 
+        for blocker in blockers:
+            blocker.unblock()
+
         # Check if Weather Dataset :
 
         if layout['wxdset'] in self.dmngr.wxdsets:
@@ -819,13 +935,10 @@ class HydroprintGUI(QWidget):
                   'datemode': self.time_scale_label.currentText()}
         layout['wxdset'] = None if self.wxdset is None else self.wxdset.name
 
-        year = self.date_start_widget.date().year()
-        month = self.date_start_widget.date().month()
-        layout['TIMEmin'] = xldate_from_date_tuple((year, month, 1), 0)
-
-        year = self.date_end_widget.date().year()
-        month = self.date_end_widget.date().month()
-        layout['TIMEmax'] = xldate_from_date_tuple((year, month, 1), 0)
+        layout['TIMEmin'] = self.get_xldate_from_widget(
+            self.date_start_widget)
+        layout['TIMEmax'] = self.get_xldate_from_widget(
+            self.date_end_widget)
 
         if self.datum_widget.currentIndex() == 0:
             layout['WLdatum'] = 'mbgs'
@@ -858,7 +971,7 @@ class HydroprintGUI(QWidget):
 
 class PageSetupWin(QWidget):
 
-    newPageSetupSent = QSignal(bool)
+    newPageSetupSent = QSignal(list)
 
     def __init__(self, parent=None):
         super(PageSetupWin, self).__init__(parent)
@@ -1000,18 +1113,25 @@ class PageSetupWin(QWidget):
         self.close()
 
     def btn_apply_isClicked(self):
-        """Apply the selected settings and emit a signal."""
-        self.pageSize = (self.fwidth.value(), self.fheight.value())
-        self.isLegend = self.legend_on.value()
-        self.isGraphTitle = self.title_on.value()
-        self.isTrendLine = self.wltrend_on.value()
-        self.is_meteo_on = self.meteo_on.value()
-        self.is_glue_wl_on = self.glue_wl_on.value()
-        self.is_mrc_wl_on = self.mrc_wl_on.value()
-        self.va_ratio = self.va_ratio_spinBox.value()
-        self.figframe_lw = self.fframe_lw_widg.value()
-
-        self.newPageSetupSent.emit(True)
+        """
+        Apply the selected settings and emit a signal with the names of the
+        settings that changed.
+        """
+        settings = {'pageSize': (self.fwidth.value(), self.fheight.value()),
+                    'isLegend': self.legend_on.value(),
+                    'isGraphTitle': self.title_on.value(),
+                    'isTrendLine': self.wltrend_on.value(),
+                    'is_meteo_on': self.meteo_on.value(),
+                    'is_glue_wl_on': self.glue_wl_on.value(),
+                    'is_mrc_wl_on': self.mrc_wl_on.value(),
+                    'va_ratio': self.va_ratio_spinBox.value(),
+                    'figframe_lw': self.fframe_lw_widg.value()}
+        changed = [key for key, value in settings.items() if
+                   getattr(self, key) != value]
+        for key in changed:
+            setattr(self, key, settings[key])
+
+        self.newPageSetupSent.emit(changed)
 
     def closeEvent(self, event):
         """Qt method override."""
@@ -1049,7 +1169,7 @@ class PageSetupWin(QWidget):
             hp = parent.frameGeometry().height()
             cp = parent.mapToGlobal(QPoint(wp // 2, hp // 2))
         else:
-            cp = QDesktopWidget().availableGeometry().center()
+            cp = QApplication.desktop().availableGeometry().center()
 
         qr.moveCenter(cp)
         self.move(qr.topLeft())
@@ -10,7 +10,6 @@
 # ---- Standard library imports
 import os
 import os.path as osp
-import requests
 import zipfile
 import io
 
@@ -101,6 +100,10 @@ class KGSBRFInstaller(QFrame):
             QMessageBox.warning(self, 'Warning', msg, QMessageBox.Ok)
             return
 
+        # We import requests here instead of at the top of the module
+        # because it is slow to import and only needed to download kgs_brf.
+        import requests
+
         print("Installing KGS_BRF software...", end=" ")
         QApplication.setOverrideCursor(Qt.WaitCursor)
         url = "http://www.kgs.ku.edu/HighPlains/OHP/index_program/KGS_BRF.zip"
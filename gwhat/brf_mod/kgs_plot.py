@@ -203,16 +203,14 @@ class BRFFigure(Figure):
         ax.axis([xmin, xmax+10**-12, ymin-10**-12, ymax+10**-12])
 
         # Update the data.
-        self.line.set_xdata(lag)
-        self.line.set_ydata(A)
+        self.line.set_data(lag, A)
         self.line.set_visible(draw_line)
 
         indexes = np.where((lag >= xmin) & (lag <= xmax) &
                            (A >= ymin) & (A <= ymax)
                            )[0]
 
-        self.markers.set_xdata(lag[indexes])
-        self.markers.set_ydata(A[indexes])
+        self.markers.set_data(lag[indexes], A[indexes])
         self.markers.set_markersize(msize)
 
         self.errbar.remove()
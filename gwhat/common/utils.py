@@ -73,7 +73,9 @@ def save_content_to_csv(fname, fcontent, mode='w', delimiter=',',
     in arguments.
     """
     create_dirname(fname)
-    with open(fname, mode, encoding='utf8') as csvfile:
+    # A large write buffer is used so that the rows are written to the
+    # disk in a few large chunks instead of many small ones.
+    with open(fname, mode, encoding='utf8', buffering=2**20) as csvfile:
         writer = csv.writer(csvfile, delimiter=delimiter, lineterminator='\n')
         writer.writerows(fcontent)
 
@@ -91,7 +93,11 @@ def save_content_to_excel(fname, fcontent):
         wb.save(root+'.xls')
     else:
         try:
-            with xlsxwriter.Workbook(root + '.xlsx') as wb:
+            # The rows are written in order, so the constant memory mode
+            # is used to flush each row to disk instead of keeping the
+            # whole worksheet in memory until the workbook is closed.
+            with xlsxwriter.Workbook(
+                    root + '.xlsx', {'constant_memory': True}) as wb:
                 ws = wb.add_worksheet('Data')
                 for i, row in enumerate(fcontent):
                     ws.write_row(i, 0, row)
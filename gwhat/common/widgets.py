@@ -6,10 +6,6 @@
 # This file is part of GWHAT (Ground-Water Hydrograph Analysis Toolbox).
 # Licensed under the terms of the GNU General Public License.
 
-# Standard library imports :
-
-from copy import copy
-
 from gwhat.utils import icons
 
 from PyQt5.QtCore import Qt, QSize, QPoint, QUrl
@@ -28,11 +24,11 @@ class MyQComboBox(QComboBox):
         self.currentIndexChanged.connect(self.storeIndex)
 
     def storeIndex(self, index):
-        self.__oldIndex = copy(self.__newIndex)
+        self.__oldIndex = self.__newIndex
         self.__newIndex = index
 
     def revertToPrevIndex(self):
-        self.__newIndex = copy(self.__oldIndex)
+        self.__newIndex = self.__oldIndex
         self.setCurrentIndexSilently(self.__oldIndex)
 
     def setCurrentIndexSilently(self, index):
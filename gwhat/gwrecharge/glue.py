@@ -284,21 +284,42 @@ def calcul_glue(data, glue_limits, varname='recharge'):
     if varname not in ['recharge', 'etr', 'ru', 'hydrograph']:
         raise ValueError("varname value must be",
                          ['recharge', 'etr', 'ru', 'hydrograph'])
-    x = np.array(data[varname])
+    x = np.asarray(data[varname])
     _, ntime = np.shape(x)
 
     rmse = 1/np.array(data['RMSE'])
     # Rescale the RMSE so the sum of all values equal 1.
     rmse = rmse/np.sum(rmse)
 
+    # Sort the predicted values and compute the Cumulative Density
+    # Function for all time steps at once.
+    # The cumulative sum is done in place and the sorting indexes are
+    # released as soon as possible to limit the number of arrays of the
+    # size of the ensemble that are kept in memory at the same time.
+    isort = np.argsort(x, axis=0)
+    x_sorted = np.take_along_axis(x, isort, axis=0)
+    cdf = rmse[isort]
+    del isort
+    np.cumsum(cdf, axis=0, out=cdf)
+
+    # Get GLUE values for the p confidence intervals by interpolating
+    # linearly the sorted predicted values of all time steps at once,
+    # in the same way it is done by numpy.interp.
+    nmodels = len(rmse)
+    cols = np.arange(ntime)
     glue = np.zeros((ntime, len(glue_limits)))
-    for i in range(ntime):
-        # Sort predicted values.
-        isort = np.argsort(x[:, i])
-        # Compute the Cumulative Density Function.
-        cdf = np.cumsum(rmse[isort])
-        # Get GLUE values for the p confidence intervals.
-        glue[i, :] = np.interp(glue_limits, cdf, x[isort, i])
+    for j, p in enumerate(glue_limits):
+        # Index of the first value of the CDF that is greater or equal to p.
+        k = np.sum(cdf < p, axis=0)
+        k_lo = np.maximum(k - 1, 0)
+        k_hi = np.minimum(k, nmodels - 1)
+
+        cdf_lo = cdf[k_lo, cols]
+        x_lo = x_sorted[k_lo, cols]
+        x_hi = x_sorted[k_hi, cols]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (x_hi - x_lo) / (cdf[k_hi, cols] - cdf_lo)
+        glue[:, j] = np.where(k_lo == k_hi, x_hi, x_lo + slope * (p - cdf_lo))
 
     return glue
 
@@ -192,8 +192,10 @@ class RechgEvalWorker(QObject):
 
         Sy0 = np.mean(self.Sy)
         time_start = perf_counter()
-        N = sum(1 for p in product(U_Cro, U_RAS))
+        N = len(U_Cro) * len(U_RAS)
         self.sig_glue_progress.emit(0)
+        progress_time = perf_counter()
+        progress_pct = 0
         for it, (cro, rasmax) in enumerate(product(U_Cro, U_RAS)):
             rechg, ru, etr, ras, pacc = self.surf_water_budget(cro, rasmax)
             SyOpt, RMSE, wlvlest = self.optimize_specific_yield(
@@ -216,7 +218,17 @@ class RechgEvalWorker(QObject):
                     set_evapo.append(etr)
                     set_runoff.append(ru)
 
-            self.sig_glue_progress.emit((it+1)/N*100)
+            # The progress is emitted at most every 0.1 sec and only when
+            # the percentage shown in the progress bar changed, so that the
+            # event loop of the GUI is not flooded with a signal and a
+            # repaint of the progress bar for each model evaluated.
+            if it + 1 == N:
+                self.sig_glue_progress.emit(100)
+            elif perf_counter() - progress_time > 0.1:
+                progress_time = perf_counter()
+                if int((it+1)/N*100) != progress_pct:
+                    progress_pct = int((it+1)/N*100)
+                    self.sig_glue_progress.emit((it+1)/N*100)
         print("GLUE computed in {:0.1f} sec".format(perf_counter()-time_start))
         self._print_model_params_summary(set_Sy, set_Cru, set_RASmax, set_RMSE)
 
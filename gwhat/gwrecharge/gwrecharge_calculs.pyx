@@ -16,6 +16,8 @@ cimport cython
 ctypedef np.float64_t DTYPE_t
 DTYPE = np.float64
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def calcul_surf_water_budget(ndarray[np.float64_t, ndim=1] ETP, 
                              ndarray[np.float64_t, ndim=1] PTOT, 
                              ndarray[np.float64_t, ndim=1] TAVG,
@@ -87,6 +89,8 @@ def calcul_surf_water_budget(ndarray[np.float64_t, ndim=1] ETP,
     return RECHG, RU, ETR, RAS, PACC
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def calc_hydrograph_forward(ndarray[np.float64_t, ndim=1] rechg, 
                             ndarray[np.float64_t, ndim=1] wlobs,
                             double Sy, double A, double B):
@@ -94,6 +98,8 @@ def calc_hydrograph_forward(ndarray[np.float64_t, ndim=1] rechg,
     cdef int N = len(wlobs)
     cdef ndarray[np.float64_t, ndim=1] wlpre = np.zeros(N, dtype=DTYPE)
     
+    cdef double recess = 0.0
+
     wlpre[0] = wlobs[0]
     cdef Py_ssize_t i
     for i in range(N-1):
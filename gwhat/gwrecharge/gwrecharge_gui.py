@@ -8,7 +8,6 @@
 # -----------------------------------------------------------------------------
 
 # ---- Stantard imports
-import time
 import os.path as osp
 
 # ---- Third party imports
@@ -26,7 +25,7 @@ from gwhat.gwrecharge.gwrecharge_calc2 import RechgEvalWorker
 from gwhat.gwrecharge.gwrecharge_plot_results import FigureStackManager
 from gwhat.gwrecharge.glue import GLUEDataFrameBase
 from gwhat.utils.icons import QToolButtonSmall, get_iconsize, get_icon
-from gwhat.utils.qthelpers import create_toolbutton
+from gwhat.utils.qthelpers import create_toolbutton, FileSaver
 
 
 class RechgEvalWidget(QFrame):
@@ -40,7 +39,8 @@ class RechgEvalWidget(QFrame):
 
         self.wxdset = None
         self.wldset = None
-        self.figstack = FigureStackManager()
+        self._gluedf = None
+        self._figstack = None
 
         self.progressbar = QProgressBar()
         self.progressbar.setValue(0)
@@ -331,7 +331,7 @@ class RechgEvalWidget(QFrame):
         btn_calib.clicked.connect(self.btn_calibrate_isClicked)
 
         self.btn_show_result = QToolButtonSmall(get_icon('search'))
-        self.btn_show_result.clicked.connect(self.figstack.show)
+        self.btn_show_result.clicked.connect(lambda: self.figstack.show())
         self.btn_show_result.setToolTip("Show GLUE results.")
 
         self.btn_save_glue = ExportGLUEButton(self.wxdset)
@@ -350,7 +350,7 @@ class RechgEvalWidget(QFrame):
         self.setEnabled(self.wldset is not None and self.wxdset is not None)
         gluedf = None if wldset is None else wldset.get_glue_at(-1)
         self._setup_ranges_from_wldset(gluedf)
-        self.figstack.set_gluedf(gluedf)
+        self._set_figstack_gluedf(gluedf)
         self.btn_save_glue.set_model(gluedf)
 
     def set_wxdset(self, wxdset):
@@ -363,50 +363,68 @@ class RechgEvalWidget(QFrame):
         Set the parameter range values from the last values that were used
         to produce the last GLUE results saved into the project.
         """
-        if gluedf is not None:
-            try:
-                # This was introduced in gwhat 0.5.1.
-                self.rmsecutoff_sbox.setValue(gluedf['cutoff']['rmse_cutoff'])
-                self.rmsecutoff_cbox.setChecked(
-                    gluedf['cutoff']['rmse_cutoff_enabled'])
-            except KeyError:
-                pass
-            try:
-                self.QSy_min.setValue(min(gluedf['ranges']['Sy']))
-                self.QSy_max.setValue(max(gluedf['ranges']['Sy']))
-            except KeyError:
-                pass
-            try:
-                self.CRO_min.setValue(min(gluedf['ranges']['Cro']))
-                self.CRO_max.setValue(max(gluedf['ranges']['Cro']))
-            except KeyError:
-                pass
-            try:
-                self.QRAS_min.setValue(min(gluedf['ranges']['RASmax']))
-                self.QRAS_max.setValue(max(gluedf['ranges']['RASmax']))
-            except KeyError:
-                pass
-            try:
-                self._Tmelt.setValue(gluedf['params']['tmelt'])
-                self._CM.setValue(gluedf['params']['CM'])
-                self._deltaT.setValue(gluedf['params']['deltat'])
-            except KeyError:
-                pass
+        if gluedf is None:
+            return
+
+        # This was introduced in gwhat 0.5.1.
+        cutoff = gluedf.get('cutoff') or {}
+        if 'rmse_cutoff' in cutoff:
+            self.rmsecutoff_sbox.setValue(cutoff['rmse_cutoff'])
+        if 'rmse_cutoff_enabled' in cutoff:
+            self.rmsecutoff_cbox.setChecked(cutoff['rmse_cutoff_enabled'])
+
+        ranges = gluedf.get('ranges') or {}
+        for name, sbox_min, sbox_max in [
+                ('Sy', self.QSy_min, self.QSy_max),
+                ('Cro', self.CRO_min, self.CRO_max),
+                ('RASmax', self.QRAS_min, self.QRAS_max)]:
+            if name in ranges:
+                sbox_min.setValue(min(ranges[name]))
+                sbox_max.setValue(max(ranges[name]))
+
+        params = gluedf.get('params') or {}
+        for name, sbox in [('tmelt', self._Tmelt),
+                           ('CM', self._CM),
+                           ('deltat', self._deltaT)]:
+            if name in params:
+                sbox.setValue(params[name])
 
     def get_params_range(self, name):
+        """
+        Return the range of values for the parameter corresponding to
+        the specified name as a (min, max) tuple.
+        """
         if name == 'Sy':
-            return (min(self.QSy_min.value(), self.QSy_max.value()),
-                    max(self.QSy_min.value(), self.QSy_max.value()))
+            sboxes = (self.QSy_min, self.QSy_max)
         elif name == 'RASmax':
-            return (min(self.QRAS_min.value(), self.QRAS_max.value()),
-                    max(self.QRAS_min.value(), self.QRAS_max.value()))
+            sboxes = (self.QRAS_min, self.QRAS_max)
         elif name == 'Cro':
-            return (min(self.CRO_min.value(), self.CRO_max.value()),
-                    max(self.CRO_min.value(), self.CRO_max.value()))
+            sboxes = (self.CRO_min, self.CRO_max)
         else:
             raise ValueError('Name must be either Sy, Rasmax or Cro.')
+        return tuple(sorted(sbox.value() for sbox in sboxes))
 
     # ---- Properties.
+    @property
+    def figstack(self):
+        """
+        Return the manager of the figures used to show the GLUE results.
+
+        The manager is created the first time it is needed, so that its
+        figures and canvas are not allocated if the results are never shown.
+        """
+        if self._figstack is None:
+            self._figstack = FigureStackManager()
+            if self._gluedf is not None:
+                self._figstack.set_gluedf(self._gluedf)
+        return self._figstack
+
+    def _set_figstack_gluedf(self, gluedf):
+        """Set the GLUE data that are shown in the figures stack manager."""
+        self._gluedf = gluedf
+        if self._figstack is not None:
+            self._figstack.set_gluedf(gluedf)
+
     @property
     def Tmelt(self):
         return self._Tmelt.value()
@@ -455,13 +473,20 @@ class RechgEvalWidget(QFrame):
         self.setEnabled(False)
         self.progressbar.show()
 
-        waittime = 0
-        while self.rechg_thread.isRunning():
-            time.sleep(0.1)
-            waittime += 0.1
-            if waittime > 15:
-                print('Impossible to quit the thread.')
-                return
+        if self.rechg_thread.isRunning():
+            # The thread is still shutting down after the last computation,
+            # so it is started again as soon as it is finished.
+            self.rechg_thread.finished.connect(self._restart_rechg_thread)
+        else:
+            self.rechg_thread.start()
+
+    @QSlot()
+    def _restart_rechg_thread(self):
+        """
+        Start the thread to evaluate ground-water recharge after it
+        finished shutting down from the last computation.
+        """
+        self.rechg_thread.finished.disconnect(self._restart_rechg_thread)
         self.rechg_thread.start()
 
     def receive_glue_calcul(self, glue_dataframe):
@@ -485,13 +510,15 @@ class RechgEvalWidget(QFrame):
             self.sig_new_gluedf.emit(glue_dataframe)
 
             self.btn_save_glue.set_model(glue_dataframe)
-            self.figstack.set_gluedf(glue_dataframe)
+            self._set_figstack_gluedf(glue_dataframe)
         self.progressbar.hide()
         self.setEnabled(True)
 
     def close(self):
         """Extend Qt method to close child windows."""
-        self.figstack.close()
+        if self._figstack is not None:
+            self._figstack.close()
+        self.btn_save_glue.close()
         super().close()
 
 
@@ -507,6 +534,17 @@ class ExportGLUEButton(ExportDataButton):
         super(ExportGLUEButton, self).__init__(model, parent)
         self.setIconSize(get_iconsize('small'))
 
+        # Save the GLUE data in a separate thread, so that the GUI does not
+        # freeze while large files are written.
+        self._retry_save_func = None
+        self.file_saver = FileSaver(self)
+        self.file_saver.sig_save_error.connect(self._handle_save_error)
+
+    def close(self):
+        """Extend Qt method to wait for the GLUE data to be saved."""
+        self.file_saver.wait()
+        super().close()
+
     def setup_menu(self):
         """Setup the menu of the button tailored to the model."""
         super(ExportGLUEButton, self).setup_menu()
@@ -532,14 +570,9 @@ class ExportGLUEButton(ExportDataButton):
             "Save GLUE likelyhood measures",
             savefilename, "*.xlsx;;*.xls;;*.csv")
         if savefilename:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            QApplication.processEvents()
-            try:
-                self.model.save_glue_likelyhood_measures(savefilename)
-            except PermissionError:
-                self.show_permission_error()
-                self.save_likelyhood_measures(savefilename)
-            QApplication.restoreOverrideCursor()
+            self._save_glue_in_thread(
+                self.model.save_glue_likelyhood_measures, savefilename,
+                self.save_likelyhood_measures)
 
     @QSlot()
     def save_water_budget_tofile(self, savefilename=None):
@@ -553,14 +586,9 @@ class ExportGLUEButton(ExportDataButton):
             "Save GLUE water budget", savefilename, "*.xlsx;;*.xls;;*.csv")
 
         if savefilename:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            QApplication.processEvents()
-            try:
-                self.model.save_mly_glue_budget_to_file(savefilename)
-            except PermissionError:
-                self.show_permission_error()
-                self.save_water_budget_tofile(savefilename)
-            QApplication.restoreOverrideCursor()
+            self._save_glue_in_thread(
+                self.model.save_mly_glue_budget_to_file, savefilename,
+                self.save_water_budget_tofile)
 
     @QSlot()
     def save_water_levels_tofile(self, savefilename=None):
@@ -574,14 +602,29 @@ class ExportGLUEButton(ExportDataButton):
             "Save GLUE water levels", savefilename, "*.xlsx;;*.xls;;*.csv")
 
         if savefilename:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            QApplication.processEvents()
-            try:
-                self.model.save_glue_waterlvl_to_file(savefilename)
-            except PermissionError:
-                self.show_permission_error()
-                self.save_water_levels_tofile(savefilename)
-            QApplication.restoreOverrideCursor()
+            self._save_glue_in_thread(
+                self.model.save_glue_waterlvl_to_file, savefilename,
+                self.save_water_levels_tofile)
+
+    def _save_glue_in_thread(self, save_func, savefilename, retry_func):
+        """
+        Save the GLUE data to a file with the provided save function in a
+        separate thread. If the file is in use, the retry function is called
+        with the file name after the user was warned.
+        """
+        self._retry_save_func = retry_func
+        self.file_saver.save(save_func, savefilename)
+
+    @QSlot(str, object)
+    def _handle_save_error(self, fname, error):
+        """Handle when the GLUE data could not be saved to a file."""
+        if isinstance(error, PermissionError):
+            self.show_permission_error()
+            self._retry_save_func(fname)
+        else:
+            msg = ("The GLUE data could not be saved in {} because of the "
+                   "following error:<br><br>{}").format(fname, error)
+            QMessageBox.warning(self, 'Warning', msg, QMessageBox.Ok)
 
 
 if __name__ == '__main__':
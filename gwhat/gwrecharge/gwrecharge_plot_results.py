@@ -72,40 +72,59 @@ class FigureStackManager(QWidget):
         layout.addWidget(self.stack, 0, 0)
 
     def setup_stack(self):
-        fig_rechg_glue = FigureManager(
-            FigYearlyRechgGLUE,
-            setp_panels=[FigSizePanel(),
-                         YAxisOptPanel(),
-                         YearLimitsPanel(),
-                         TextOptPanel()])
-        fig_watbudg_glue = FigureManager(
-            FigWaterBudgetGLUE,
-            setp_panels=[FigSizePanel(),
-                         YAxisOptPanel(),
-                         YearLimitsPanel(),
-                         TextOptPanel()])
-        fig_avg_yearly_budg = FigureManager(
-            FigAvgYearlyBudget,
-            setp_panels=[FigSizePanel(),
-                         YAxisOptPanel(),
-                         TextOptPanel(xlabelsize=False, legendsize=False)])
-        fig_avg_monthly_budg = FigureManager(
-            FigAvgMonthlyBudget,
-            setp_panels=[FigSizePanel(),
-                         YAxisOptPanel(),
-                         TextOptPanel(xlabelsize=False, notesize=False)])
-
-        self.figmanagers = [fig_rechg_glue, fig_watbudg_glue,
-                            fig_avg_yearly_budg, fig_avg_monthly_budg]
+        # The figure managers are created only when their tab is shown for
+        # the first time, so that the figure and canvas of the tabs that are
+        # never looked at are not allocated.
+        self.figmanagers = [None] * 4
         self.__plot_results_pending = [True] * len(self.figmanagers)
 
         self.stack = QTabWidget()
-        self.stack.addTab(fig_rechg_glue, 'Recharge')
-        self.stack.addTab(fig_watbudg_glue, 'Yearly Budget')
-        self.stack.addTab(fig_avg_yearly_budg, 'Yearly Avg. Budget')
-        self.stack.addTab(fig_avg_monthly_budg, 'Monthly Avg. Budget')
+        for title in ['Recharge', 'Yearly Budget', 'Yearly Avg. Budget',
+                      'Monthly Avg. Budget']:
+            tab = QWidget()
+            layout = QGridLayout(tab)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self.stack.addTab(tab, title)
         self.stack.currentChanged.connect(self.plot_results)
 
+    def get_figmanager(self, index):
+        """
+        Return the figure manager of the tab at index and create it if it
+        does not exist yet.
+        """
+        if self.figmanagers[index] is None:
+            if index == 0:
+                figmanager = FigureManager(
+                    FigYearlyRechgGLUE,
+                    setp_panels=[FigSizePanel(),
+                                 YAxisOptPanel(),
+                                 YearLimitsPanel(),
+                                 TextOptPanel()])
+            elif index == 1:
+                figmanager = FigureManager(
+                    FigWaterBudgetGLUE,
+                    setp_panels=[FigSizePanel(),
+                                 YAxisOptPanel(),
+                                 YearLimitsPanel(),
+                                 TextOptPanel()])
+            elif index == 2:
+                figmanager = FigureManager(
+                    FigAvgYearlyBudget,
+                    setp_panels=[FigSizePanel(),
+                                 YAxisOptPanel(),
+                                 TextOptPanel(xlabelsize=False,
+                                              legendsize=False)])
+            elif index == 3:
+                figmanager = FigureManager(
+                    FigAvgMonthlyBudget,
+                    setp_panels=[FigSizePanel(),
+                                 YAxisOptPanel(),
+                                 TextOptPanel(xlabelsize=False,
+                                              notesize=False)])
+            self.stack.widget(index).layout().addWidget(figmanager, 0, 0)
+            self.figmanagers[index] = figmanager
+        return self.figmanagers[index]
+
     def set_gluedf(self, gluedf):
         """Set the namespace for the GLUE results dataset."""
         self.gluedf = gluedf
@@ -128,16 +147,20 @@ class FigureStackManager(QWidget):
         if self.__plot_results_pending[index] is True:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             self.__plot_results_pending[index] = False
+            figcanvas = self.get_figmanager(index).figcanvas
             if self.gluedf is not None:
-                self.figmanagers[index].figcanvas.plot(self.gluedf)
+                figcanvas.plot(self.gluedf)
             else:
-                self.figmanagers[index].figcanvas.clear_figure(silent=False)
+                figcanvas.clear_figure(silent=False)
             QApplication.restoreOverrideCursor()
+        else:
+            self.get_figmanager(index)
 
     def clear_figures(self):
         """Clear the figures of all figure canvas of the stack."""
         for figmanager in self.figmanagers:
-            figmanager.figcanvas.clear_figure(silent=False)
+            if figmanager is not None:
+                figmanager.figcanvas.clear_figure(silent=False)
 
     def show(self):
         """Qt method override."""
@@ -1237,8 +1260,7 @@ class FigYearlyRechgGLUE(FigCanvasBase):
         glue25_yr = glue_rechg_yr[:, 1]
         glue75_yr = glue_rechg_yr[:, -2]
 
-        self.glue_year_rechg_avg = tuple(
-            np.mean(glue_rechg_yr[:, i]) for i in range(5))
+        self.glue_year_rechg_avg = tuple(np.mean(glue_rechg_yr, axis=0))
 
         # ---- Xticks format
 
@@ -1248,10 +1270,11 @@ class FigYearlyRechgGLUE(FigCanvasBase):
 
         # ----- ticks format
 
-        ymax0 = np.ceil(np.max(glue95_yr)/10)*10 + 50
+        glue95_yr_max = np.max(glue95_yr)
+        ymax0 = np.ceil(glue95_yr_max/10)*10 + 50
         ymin0 = 0
-        scale_yticks = 50 if np.max(glue95_yr) < 250 else 250
-        scale_yticks_minor = 10 if np.max(glue95_yr) < 250 else 50
+        scale_yticks = 50 if glue95_yr_max < 250 else 250
+        scale_yticks_minor = 10 if glue95_yr_max < 250 else 50
 
         ax0.yaxis.set_ticks_position('left')
         ax0.grid(axis='y', color=[0.35, 0.35, 0.35], linestyle=':',
@@ -1259,8 +1282,8 @@ class FigYearlyRechgGLUE(FigCanvasBase):
 
         # ---- Axis range
 
-        self.setp['xmin'] = min(year_range)
-        self.setp['xmax'] = max(year_range)
+        self.setp['xmin'] = np.min(year_range)
+        self.setp['xmax'] = np.max(year_range)
         self.setp['ymin'] = ymin0
         self.setp['ymax'] = ymax0
         self.setp['yscl'] = scale_yticks
@@ -1278,7 +1301,9 @@ class FigYearlyRechgGLUE(FigCanvasBase):
                              color='black', mew=1, mfc='White', mec='black',
                              ms=6, zorder=300)
 
-        yerr = [glue50_yr-glue05_yr, glue95_yr-glue50_yr]
+        yerr = np.empty((2, len(year_range)))
+        np.subtract(glue50_yr, glue05_yr, out=yerr[0])
+        np.subtract(glue95_yr, glue50_yr, out=yerr[1])
         self.g0595 = ax0.errorbar(year_range, glue50_yr, yerr=yerr,
                                   fmt='none', capthick=1, capsize=4,
                                   ecolor='0', elinewidth=1, zorder=200)
@@ -1380,21 +1405,12 @@ class FigYearlyRechgGLUE(FigCanvasBase):
     def refresh_yearly_avg_legend_text(self):
         """Set the text and position of for the yearly averages results."""
         if self.setp['language'] == 'french':
-            text = ("Recharge annuelle moyenne :\n"
-                    "(GLUE 5) %d mm/a ; "
-                    "(GLUE 25) %d mm/a ; "
-                    "(GLUE 50) %d mm/a ; "
-                    "(GLUE 75) %d mm/a ; "
-                    "(GLUE 95) %d mm/a"
-                    ) % self.glue_year_rechg_avg
+            title, units = "Recharge annuelle moyenne", "mm/a"
         else:
-            text = ("Mean annual recharge :\n"
-                    "(GLUE 5) %d mm/y ; "
-                    "(GLUE 25) %d mm/y ; "
-                    "(GLUE 50) %d mm/y ; "
-                    "(GLUE 75) %d mm/y ; "
-                    "(GLUE 95) %d mm/y"
-                    ) % self.glue_year_rechg_avg
+            title, units = "Mean annual recharge", "mm/y"
+        text = "%s :\n" % title + " ; ".join(
+            "(GLUE %d) %d %s" % (p, avg, units) for p, avg in
+            zip((5, 25, 50, 75, 95), self.glue_year_rechg_avg))
         self.txt_yearly_avg.set_text(text)
 
     def setup_legend(self,):
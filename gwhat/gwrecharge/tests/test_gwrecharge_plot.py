@@ -62,6 +62,20 @@ def test_figstackmanager(figstackmanager, project):
         figstackmanager.stack.setCurrentIndex(index)
 
 
+def test_figmanagers_created_on_demand(figstackmanager):
+    """
+    Test that the figure managers are created only when their tab is shown
+    for the first time.
+    """
+    assert figstackmanager.figmanagers[0] is not None
+    assert figstackmanager.figmanagers[1:] == [None, None, None]
+
+    figstackmanager.stack.setCurrentIndex(2)
+    assert figstackmanager.figmanagers[2] is not None
+    assert figstackmanager.figmanagers[1] is None
+    assert figstackmanager.figmanagers[3] is None
+
+
 def test_copy_to_clipboard(qtbot, figstackmanager, project):
     """
     Test that copying figures to the clipboard works as expected.
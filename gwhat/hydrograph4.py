@@ -5,35 +5,40 @@
 #
 # This file is part of GWHAT (Ground-Water Hydrograph Analysis Toolbox).
 # Licensed under the terms of the GNU General Public License.
-#
-# The function filt_data is based on the codes provided by
-# StackOverflow user Alleo.
-# https://stackoverflow.com/a/27681394/4481445
 # -----------------------------------------------------------------------------
 
 # ---- Standard library imports
-from calendar import monthrange
+from functools import lru_cache
 
 # ---- Third party imports
 import numpy as np
 import matplotlib as mpl
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Rectangle
 from matplotlib.figure import Figure
-from matplotlib.transforms import ScaledTranslation
+from matplotlib.transforms import Bbox, ScaledTranslation
 # import matplotlib.patches
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 import pandas as pd
 
-from xlrd.xldate import xldate_from_date_tuple
-from xlrd import xldate_as_tuple
-
 # ---- Local imports
-from gwhat.utils.dates import datetimeindex_to_xldates
+from gwhat.utils.dates import (
+    datetimeindex_to_xldates, xldates_to_datetimeindex, datetime64_to_xldates,
+    xldates_to_datetime64)
 from gwhat.common.utils import calc_dist_from_coord
 from gwhat.config.colors import ColorsManager
 
 mpl.rc('font', **{'family': 'sans-serif', 'sans-serif': ['Arial']})
 
+# The scales that can be selected for the water level axis.
+WL_SCALES = np.hstack((np.arange(0.05, 0.30, 0.05),
+                       np.arange(0.3, 5.1, 0.1)))
+
+# The keyword arguments of tick_params to hide the ticks and tick labels.
+TICKS_OFF = dict(bottom=False, top=False, left=False, right=False,
+                 labelbottom=False, labelleft=False)
+
 
 class LabelDatabase():
 
@@ -75,6 +80,35 @@ class LabelDatabase():
                            'Récession simulée']
 
 
+@lru_cache(maxsize=None)
+def get_label_database(language):
+    """
+    Return the database of labels for the specified language.
+
+    The labels are never modified after the database is created, so the
+    same database is shared by all the hydrographs drawn in a language.
+    """
+    return LabelDatabase(language)
+
+
+def get_missing_values_xldates(missing_value_indexes):
+    """
+    Return the Excel numeric dates to plot the periods of missing daily
+    values as lines. Each missing day spans from its start to the start
+    of the next day, and the days in between periods of missing values
+    are set to nan, so that each period is drawn as a separate line.
+    """
+    oneday = np.timedelta64(1, 'D')
+    days = np.asarray(missing_value_indexes, dtype='datetime64[D]')
+    days = np.union1d(days, days + oneday)
+    if len(days) == 0:
+        return np.array([])
+    alldays = np.arange(days[0], days[-1] + oneday)
+    xldates = datetime64_to_xldates(alldays)
+    xldates[~np.isin(alldays, days)] = np.nan
+    return xldates
+
+
 class Hydrograph(Figure):
     def __init__(self):
         super().__init__(facecolor='white', frameon=True, edgecolor='black')
@@ -85,6 +119,7 @@ class Hydrograph(Figure):
         self.canvas.get_renderer()
 
         self.__isHydrographExists = False
+        self.__isHydrographUpToDate = False
 
         # Fig Init :
 
@@ -149,10 +184,14 @@ class Hydrograph(Figure):
 
         # Bin Redistributed Weather :
 
-        self.bTIME = np.array([])
-        self.bTMAX = np.array([])
-        self.bPTOT = np.array([])
-        self.bRAIN = np.array([])
+        # The binned time is stored in float64 to preserve the precision of
+        # the Excel dates, while the binned weather data are stored together
+        # in a single contiguous (3, nbin) float32 array, whose rows are the
+        # maximum air temperature, total precipitation and rain. The results
+        # are cached per weather dataset and bin width in _bins.
+        self._btime = np.array([])
+        self._bweather = np.empty((3, 0), dtype='float32')
+        self._bins = {}
 
         self.bwidth_indx = 1
         #   0: 1 day;
@@ -161,6 +200,33 @@ class Hydrograph(Figure):
         #   3: 1 year;
 
         self.NMissPtot = []
+        self._legend_key = None
+        self._dist_coords = None
+        self._xticks_key = None
+        self._ptot_max = None
+        self._wlfilt = None
+        self._wl_mbgs = None
+        self._wl_masl = None
+
+    @property
+    def bTIME(self):
+        """Return the time of the binned weather data."""
+        return self._btime
+
+    @property
+    def bTMAX(self):
+        """Return the binned maximum air temperature."""
+        return self._bweather[0]
+
+    @property
+    def bPTOT(self):
+        """Return the binned total precipitation."""
+        return self._bweather[1]
+
+    @property
+    def bRAIN(self):
+        """Return the binned rain."""
+        return self._bweather[2]
 
     @property
     def meteo_on(self):
@@ -173,6 +239,8 @@ class Hydrograph(Figure):
 
     def set_meteo_on(self, x):
         """Set whether the meteo data are plotted or not."""
+        if bool(x) == self.__meteo_on:
+            return
         self.meteo_on = x
         if self.__isHydrographExists:
             self.ax3.set_visible(self.meteo_on)
@@ -191,6 +259,8 @@ class Hydrograph(Figure):
 
     def set_glue_wl_on(self, x):
         """Set whether the glue water levels data are plotted or not."""
+        if bool(x) == self.__glue_wl_on:
+            return
         self.glue_wl_on = x
         if self.__isHydrographExists:
             self.draw_glue_wl()
@@ -209,6 +279,8 @@ class Hydrograph(Figure):
 
     def set_mrc_wl_on(self, x):
         """Set whether the mrc water levels data must plotted or not."""
+        if bool(x) == self.__mrc_wl_on:
+            return
         self.mrc_wl_on = x
         if self.__isHydrographExists:
             self.draw_mrc_wl()
@@ -238,11 +310,32 @@ class Hydrograph(Figure):
     def isHydrographExists(self):
         return self.__isHydrographExists
 
+    @property
+    def isHydrographUpToDate(self):
+        """
+        Return whether the hydrograph was generated with the current water
+        level and weather datasets.
+        """
+        return self.__isHydrographExists and self.__isHydrographUpToDate
+
     def set_wldset(self, wldset):
         self.wldset = wldset
+        self._wlfilt = None
+
+        # The water levels are computed once for both datums, so that
+        # they are not computed again each time they are drawn.
+        if wldset is None:
+            self._wl_mbgs = None
+            self._wl_masl = None
+        else:
+            self._wl_mbgs = np.asarray(wldset['WL'])
+            self._wl_masl = wldset['Elevation'] - self._wl_mbgs
+        self.__isHydrographUpToDate = False
 
     def set_wxdset(self, wxdset):
         self.wxdset = wxdset
+        self._bins = {}
+        self.__isHydrographUpToDate = False
 
     def set_gluedf(self, gluedf):
         """Set the namespace for the GLUE dataframe."""
@@ -253,11 +346,13 @@ class Hydrograph(Figure):
     def clf(self, *args, **kargs):
         """Matplotlib override to set internal flag."""
         self.__isHydrographExists = False
+        self.__isHydrographUpToDate = False
         super(Hydrograph, self).clf(*args, **kargs)
 
-    def savefig(self, fname, dpi=300):
+    def savefig(self, fname, dpi=300, **kwargs):
         """Matplotlib override to set frameon when saving."""
-        super().savefig(fname, facecolor='white', edgecolor='black', dpi=dpi)
+        super().savefig(fname, facecolor='white', edgecolor='black', dpi=dpi,
+                        **kwargs)
 
     def generate_hydrograph(self, wxdset=None, wldset=None):
         wxdset = self.wxdset if wxdset is None else wxdset
@@ -277,10 +372,14 @@ class Hydrograph(Figure):
             self.RAIN = np.array([])
         else:
             self.name_meteo = wxdset.metadata['Station Name']
-            self.TIMEmeteo = datetimeindex_to_xldates(wxdset.data.index)
-            self.TMAX = wxdset.data['Tmax'].values
-            self.PTOT = wxdset.data['Ptot'].values
-            self.RAIN = wxdset.data['Rain'].values
+            self.TIMEmeteo = wxdset.get_xldates()
+            # The weather data are only used for display, so we store them
+            # as separate contiguous float32 arrays to halve the amount of
+            # memory read when binning and plotting them. The time must be
+            # kept in float64 to preserve the precision of the Excel dates.
+            self.TMAX = wxdset.data['Tmax'].values.astype('float32')
+            self.PTOT = wxdset.data['Ptot'].values.astype('float32')
+            self.RAIN = wxdset.data['Rain'].values.astype('float32')
 
         # Resample Data in Bins :
 
@@ -295,19 +394,22 @@ class Hydrograph(Figure):
         self.ax1 = self.add_axes([0, 0, 1, 1], frameon=False)
         self.ax1.set_zorder(100)
 
+        # All the other axes are overlaid on the host axe. Their position
+        # is set afterwards in set_margins.
+        host_position = self.ax1.get_position()
+
         # ---- Frame ----
 
         # Only used to display the frame so it is always on top.
 
-        self.ax0 = self.add_axes(self.ax1.get_position(), frameon=True)
+        self.ax0 = self.add_axes(host_position, frameon=True)
         self.ax0.patch.set_visible(False)
         self.ax0.set_zorder(self.ax1.get_zorder() + 200)
-        self.ax0.tick_params(bottom=False, top=False, left=False, right=False,
-                             labelbottom=False, labelleft=False)
+        self.ax0.tick_params(**TICKS_OFF)
 
         # ---- Water Levels ----
 
-        self.ax2 = self.add_axes(self.ax1.get_position(), frameon=False,
+        self.ax2 = self.add_axes(host_position, frameon=False,
                                  label='axes2', sharex=self.ax1)
         self.ax2.set_zorder(self.ax1.get_zorder() + 100)
         self.ax2.yaxis.set_ticks_position('left')
@@ -316,20 +418,19 @@ class Hydrograph(Figure):
 
         # ---- Precipitation ----
 
-        self.ax3 = self.add_axes(self.ax1.get_position(), frameon=False,
+        self.ax3 = self.add_axes(host_position, frameon=False,
                                  label='axes3', sharex=self.ax1)
         self.ax3.set_zorder(self.ax1.get_zorder() + 150)
         self.ax3.set_navigate(False)
 
         # ---- Air Temperature ----
 
-        self.ax4 = self.add_axes(self.ax1.get_position(), frameon=False,
+        self.ax4 = self.add_axes(host_position, frameon=False,
                                  label='axes4', sharex=self.ax1)
         self.ax4.set_zorder(self.ax1.get_zorder() + 150)
         self.ax4.set_navigate(False)
         self.ax4.set_axisbelow(True)
-        self.ax4.tick_params(bottom=False, top=False, left=False,
-                             right=False, labelbottom=False, labelleft=False)
+        self.ax4.tick_params(**TICKS_OFF)
 
         if self.meteo_on is False:
             self.ax3.set_visible(False)
@@ -337,21 +438,14 @@ class Hydrograph(Figure):
 
         # ---- Bottom Graph Grid ----
 
-        self.axLow = self.add_axes(self.ax1.get_position(), frameon=False,
+        self.axLow = self.add_axes(host_position, frameon=False,
                                    label='axLow', sharex=self.ax1)
         self.axLow.patch.set_visible(False)
         self.axLow.set_zorder(self.ax2.get_zorder() - 50)
-        self.axLow.tick_params(bottom=False, top=False, left=False,
-                               right=False, labelbottom=False, labelleft=False)
+        self.axLow.tick_params(**TICKS_OFF)
 
         self.setup_waterlvl_scale()
 
-        # -------------------------------------------------- Remove Spines ----
-
-        for axe in self.axes[2:]:
-            for loc in axe.spines:
-                axe.spines[loc].set_visible(False)
-
         # ------------------------------------------------- Update margins ----
 
         self.bottom_margin = 0.75
@@ -360,12 +454,18 @@ class Hydrograph(Figure):
         # --------------------------------------------------- FIGURE TITLE ----
 
         # Calculate horizontal distance between weather station and
-        # observation well.
+        # observation well. The distance is only computed again when the
+        # coordinates changed since the last time the hydrograph was
+        # generated.
         if self.wxdset is not None:
-            self.dist = calc_dist_from_coord(
-                wldset['Latitude'], wldset['Longitude'],
-                wxdset.metadata['Latitude'], wxdset.metadata['Longitude'])
+            coords = (wldset['Latitude'], wldset['Longitude'],
+                      wxdset.metadata['Latitude'],
+                      wxdset.metadata['Longitude'])
+            if coords != self._dist_coords:
+                self._dist_coords = coords
+                self.dist = calc_dist_from_coord(*coords)
         else:
+            self._dist_coords = None
             self.dist = 0
 
         # Weather Station name and distance to the well
@@ -381,6 +481,7 @@ class Hydrograph(Figure):
         # ----------------------------------------------------------- TIME ----
 
         self.xlabels = []
+        self._xticks_key = None
         self.set_time_scale()
 
         self.ax1.xaxis.set_ticklabels([])
@@ -393,6 +494,11 @@ class Hydrograph(Figure):
 
         # ---- Init water level artists
 
+        # The manual measurements are read from the project file only once
+        # per hydrograph, and are computed for both datums.
+        self._wlmeas_time, self._wlmeas_mbgs = self.wldset.get_wlmeas()
+        self._wlmeas_masl = self.wldset['Elevation'] - self._wlmeas_mbgs
+
         # Continuous Line Datalogger
         self.l1_ax2, = self.ax2.plot(
             [], [], '-', zorder=10, lw=1, color=self.colorsDB.rgb['WL solid'])
@@ -413,7 +519,10 @@ class Hydrograph(Figure):
             alpha=0.85)
 
         # Predicted GLUE water levels
-        self.glue_plt, = self.ax2.plot([], [])
+        self.glue_plt = self.ax2.add_collection(
+            PolyCollection([], facecolor='0.85', lw=1, edgecolor='0.65',
+                           zorder=0),
+            autolim=False)
 
         self.draw_waterlvl()
         self.draw_glue_wl()
@@ -427,8 +536,13 @@ class Hydrograph(Figure):
         self.ax3.yaxis.set_label_position('right')
         self.ax3.tick_params(axis='y', direction='out', labelsize=10)
 
-        self.PTOT_bar, = self.ax3.plot([], [])
-        self.RAIN_bar, = self.ax3.plot([], [])
+        # The precipitation bars are each drawn as a single polygon whose
+        # vertices are updated in place in draw_weather.
+        self.PTOT_bar = self.ax3.add_collection(
+            PolyCollection([], linewidth=0.0), autolim=False)
+        self.RAIN_bar = self.ax3.add_collection(
+            PolyCollection([], linewidth=0.0), autolim=False)
+        self._ptot_max = None
         self.baseline, = self.ax3.plot(
             [self.TIMEmin, self.TIMEmax], [0, 0], 'k')
 
@@ -440,10 +554,7 @@ class Hydrograph(Figure):
 
         self.ax4.axis(ymin=TEMPmin, ymax=TEMPmax)
 
-        yticks_position = np.array([TEMPmin, 0, TEMPmax])
-        yticks_position = np.arange(
-            TEMPmin, TEMPmax + TEMPscale / 2, TEMPscale)
-        self.ax4.set_yticks(yticks_position)
+        self.ax4.set_yticks(range(TEMPmin, TEMPmax + 1, TEMPscale))
         self.ax4.yaxis.set_ticks_position('left')
         self.ax4.tick_params(axis='y', direction='out', labelsize=10)
         self.ax4.yaxis.set_label_position('left')
@@ -452,7 +563,8 @@ class Hydrograph(Figure):
         self.ax4.tick_params(axis='y', which='minor', length=0)
         self.ax4.xaxis.set_ticklabels([], minor=True)
 
-        self.l1_ax4, = self.ax4.plot([], [])  # fill shape
+        self.l1_ax4 = self.ax4.add_collection(
+            PolyCollection([], edgecolor='None'), autolim=False)  # fill shape
         self.l2_ax4, = self.ax4.plot(
             [], [], color='black', lw=1)  # contour line
 
@@ -462,21 +574,8 @@ class Hydrograph(Figure):
         vshift = 5 / 72
         offset = ScaledTranslation(0, vshift, self.dpi_scale_trans)
         if self.wxdset is not None:
-            t1 = pd.DataFrame(self.wxdset.missing_value_indexes['Ptot'],
-                              index=self.wxdset.missing_value_indexes['Ptot'],
-                              columns=['datetime'])
-            t2 = pd.DataFrame(self.wxdset.missing_value_indexes['Ptot'] +
-                              pd.Timedelta('1 days'),
-                              self.wxdset.missing_value_indexes['Ptot'] +
-                              pd.Timedelta('1 days'),
-                              columns=['datetime'])
-            time = datetimeindex_to_xldates(pd.DatetimeIndex(
-                pd.concat([t1, t2], axis=0)
-                .drop_duplicates()
-                .resample('1D')
-                .asfreq()
-                ['datetime']
-                ))
+            time = get_missing_values_xldates(
+                self.wxdset.missing_value_indexes['Ptot'])
             y = np.ones(len(time)) * self.ax4.get_ylim()[0]
         else:
             time, y = [], []
@@ -487,21 +586,8 @@ class Hydrograph(Figure):
         # Air Temperature.
         offset = ScaledTranslation(0, -vshift, self.dpi_scale_trans)
         if self.wxdset is not None:
-            t1 = pd.DataFrame(self.wxdset.missing_value_indexes['Tmax'],
-                              index=self.wxdset.missing_value_indexes['Tmax'],
-                              columns=['datetime'])
-            t2 = pd.DataFrame(self.wxdset.missing_value_indexes['Tmax'] +
-                              pd.Timedelta('1 days'),
-                              self.wxdset.missing_value_indexes['Tmax'] +
-                              pd.Timedelta('1 days'),
-                              columns=['datetime'])
-            time = datetimeindex_to_xldates(pd.DatetimeIndex(
-                pd.concat([t1, t2], axis=0)
-                .drop_duplicates()
-                .resample('1D')
-                .asfreq()
-                ['datetime']
-                ))
+            time = get_missing_values_xldates(
+                self.wxdset.missing_value_indexes['Tmax'])
             y = np.ones(len(time)) * self.ax4.get_ylim()[1]
         else:
             time, y = [], []
@@ -513,11 +599,12 @@ class Hydrograph(Figure):
         self.setup_legend()
 
         self.__isHydrographExists = True
+        self.__isHydrographUpToDate = True
 
     def setup_legend(self):
         """Setup the legend of the graph."""
         if self.isLegend == 1:
-            labelDB = LabelDatabase(self.language).legend
+            labelDB = get_label_database(self.language.lower()).legend
             lg_handles = []
             lg_labels = []
             if self.meteo_on:
@@ -555,8 +642,7 @@ class Hydrograph(Figure):
                 lg_labels.append(labelDB[6])
 
             # Manual Measures
-            TIMEmes, WLmes = self.wldset.get_wlmeas()
-            if len(TIMEmes) > 0:
+            if len(self._wlmeas_time) > 0:
                 lg_handles.append(self.h_WLmes)
                 lg_labels.append(labelDB[7])
 
@@ -569,6 +655,17 @@ class Hydrograph(Figure):
                 lg_handles.append(Rectangle(
                     (0, 0), 1, 1, fc='0.65', ec='0.65'))
 
+            # The legend is only rebuilt when its content changed, since
+            # laying it out is costly.
+            lg_key = (tuple(lg_labels), tuple(
+                to_rgba(h.get_facecolor() if isinstance(h, Rectangle) else
+                        h.get_color()) for h in lg_handles))
+            if (self.ax0.get_legend() is not None and
+                    lg_key == self._legend_key):
+                self.ax0.get_legend().set_visible(True)
+                return
+            self._legend_key = lg_key
+
             # Draw the legend
             # LOCS = ['right', 'center left', 'upper right', 'lower right',
             #         'center', 'lower left', 'center right', 'upper left',
@@ -588,10 +685,15 @@ class Hydrograph(Figure):
             return
 
         self.colorsDB.load_colors()
-        self.l1_ax2.set_color(self.colorsDB.rgb['WL solid'])
-        self.l2_ax2.set_color(self.colorsDB.rgb['WL data'])
-        self.h_WLmes.set_color(self.colorsDB.rgb['WL obs'])
-        self.draw_weather()
+        colors = self.colorsDB.rgb
+        self.l1_ax2.set_color(colors['WL solid'])
+        self.l2_ax2.set_color(colors['WL data'])
+        self.h_WLmes.set_color(colors['WL obs'])
+
+        # Nothing moved, so there is no need to redraw the weather data.
+        self.PTOT_bar.set_facecolor(colors['Snow'])
+        self.RAIN_bar.set_facecolor(colors['Rain'])
+        self.l1_ax4.set_facecolor(colors['Tair'])
         self.setup_legend()
 
     def update_fig_size(self):
@@ -600,6 +702,7 @@ class Hydrograph(Figure):
         self.set_margins()
         self.draw_ylabels()
         self.set_time_scale()
+        self.draw_waterlvl()
 
         self.canvas.draw()
 
@@ -639,19 +742,21 @@ class Hydrograph(Figure):
 
         # Host, Frame, Water Levels, Precipitation, Air Temperature
 
+        bbox_top = Bbox.from_bounds(
+            left_margin, bottom_margin + hlow, wtot, htop)
+        bbox_full = Bbox.from_bounds(left_margin, bottom_margin, wtot, htot)
+        bbox_low = Bbox.from_bounds(left_margin, bottom_margin, wtot, hlow)
         for i, axe in enumerate(self.axes):
             if i == 4:  # Air Temperature
-                axe.set_position([left_margin, bottom_margin + hlow,
-                                  wtot, htop])
+                axe.set_position(bbox_top)
             elif i in [0, 1]:  # Time, Frame
-                axe.set_position([left_margin, bottom_margin, wtot, htot])
-
+                axe.set_position(bbox_full)
             else:
-                axe.set_position([left_margin, bottom_margin, wtot, hlow])
+                axe.set_position(bbox_low)
 
     def draw_ylabels(self):
 
-        labelDB = LabelDatabase(self.language)
+        labelDB = get_label_database(self.language.lower())
 
         # ------------------------------------- Calculate LabelPadding ----
 
@@ -678,10 +783,10 @@ class Hydrograph(Figure):
                             fontsize=self.label_font_size,
                             va='bottom', ha='center')
 
-        # Get bounding box dimensions of yaxis ticklabels for ax2
+        # Get bounding box dimensions of yaxis ticklabels for ax2. The
+        # canvas does not need to be drawn first, because the ticks and
+        # their labels are updated by get_ticklabel_extents.
         renderer = self.canvas.get_renderer()
-        self.canvas.draw()
-
         bbox2_left, _ = self.ax2.yaxis.get_ticklabel_extents(renderer)
 
         # bbox are structured in the the following way:   [[ Left , Bottom ],
@@ -742,77 +847,80 @@ class Hydrograph(Figure):
         self.draw_figure_title()
 
     def best_fit_waterlvl(self):
+        # The extrema of the water levels are computed only once, without
+        # making a filtered copy of the data, and are then converted to
+        # the selected datum.
         WL = self.wldset['WL']
+        wl_min, wl_max = np.nanmin(WL), np.nanmax(WL)
         if self.WLdatum == 1:  # masl
-            WL = self.wldset['Elevation'] - WL
+            elevation = self.wldset['Elevation']
+            wl_min, wl_max = elevation - wl_max, elevation - wl_min
 
-        WL = WL[~np.isnan(WL)]
-        dWL = np.max(WL) - np.min(WL)
+        dWL = wl_max - wl_min
         ygrid = self.NZGrid - 5
 
         # --- WL Scale --- #
 
-        SCALE = np.hstack((np.arange(0.05, 0.30, 0.05),
-                           np.arange(0.3, 5.1, 0.1)))
-        dSCALE = np.abs(SCALE - dWL / ygrid)
-        indx = np.where(dSCALE == np.min(dSCALE))[0][0]
-
-        self.WLscale = SCALE[indx]
+        indx = np.argmin(np.abs(WL_SCALES - dWL / ygrid))
+        self.WLscale = WL_SCALES[indx]
 
         # ---- WL Min Value --- #
 
         if self.WLdatum == 0:  # mbgs
-            N = np.ceil(np.max(WL)/self.WLscale)
+            N = np.ceil(wl_max / self.WLscale)
         elif self.WLdatum == 1:  # masl
             # WL = self.WaterLvlObj.ALT - WL
-            N = np.floor(np.min(WL) / self.WLscale)
+            N = np.floor(wl_min / self.WLscale)
 
         self.WLmin = self.WLscale * N
 
         return self.WLscale, self.WLmin
 
     def best_fit_time(self, TIME):  # =========================================
+        """
+        Set the time limits of the graph to the start of the month of the
+        first date and to the start of the month following the last date.
+        """
+        months = xldates_to_datetime64(
+            [TIME[0], TIME[-1]]).astype('datetime64[M]')
+        months[1] += 1
+        self.TIMEmin, self.TIMEmax = datetime64_to_xldates(months)
 
-        # ----- Data Start -----
-
-        date0 = xldate_as_tuple(TIME[0], 0)
-        date0 = (date0[0], date0[1], 1)
-
-        self.TIMEmin = xldate_from_date_tuple(date0, 0)
-
-        # ----- Date End -----
-
-        date1 = xldate_as_tuple(TIME[-1], 0)
-
-        year = date1[0]
-        month = date1[1] + 1
-        if month > 12:
-            month = 1
-            year += 1
-
-        date1 = (year, month, 1)
-
-        self.TIMEmax = xldate_from_date_tuple(date1, 0)
+        years = months.astype('datetime64[Y]').astype(int) + 1970
+        months = months.astype(int) % 12 + 1
+        date0 = (int(years[0]), int(months[0]), 1)
+        date1 = (int(years[1]), int(months[1]), 1)
 
         return date0, date1
 
     def resample_bin(self):  # ================================================
-
+        """
+        Resample the weather data in bins of the selected width. The results
+        are cached per weather dataset and bin width, so that the data are
+        binned only once.
+        """
         # day; week; month; year
         self.bwidth = [1, 7, 30, 365][self.bwidth_indx]
         bwidth = self.bwidth
 
-        if self.bwidth_indx == 0:  # daily
+        key = (id(self.wxdset), self.bwidth_indx)
+        try:
+            self._btime, self._bweather = self._bins[key]
+            return
+        except KeyError:
+            pass
 
-            self.bTIME = np.copy(self.TIMEmeteo)
-            self.bTMAX = np.copy(self.TMAX)
-            self.bPTOT = np.copy(self.PTOT)
-            self.bRAIN = np.copy(self.RAIN)
+        weather = np.vstack((self.TMAX, self.PTOT, self.RAIN))
+        if self.bwidth_indx == 0:  # daily
+            # The binned data are never modified in place, so there is no
+            # need to copy the daily time.
+            self._btime = self.TIMEmeteo
+            self._bweather = weather
         else:
-            self.bTIME = self.bin_sum(self.TIMEmeteo, bwidth) / bwidth
-            self.bTMAX = self.bin_sum(self.TMAX, bwidth) / bwidth
-            self.bPTOT = self.bin_sum(self.PTOT, bwidth)
-            self.bRAIN = self.bin_sum(self.RAIN, bwidth)
+            self._btime = self.bin_sum(self.TIMEmeteo, bwidth) / bwidth
+            self._bweather = self.bin_sum(weather, bwidth)
+            self._bweather[0] /= bwidth
+        self._bins[key] = (self._btime, self._bweather)
 
 #        elif self.bwidth_indx == 4 : # monthly
 #            print('option not yet available, kept default of 1 day')
@@ -822,16 +930,17 @@ class Hydrograph(Figure):
 
     def bin_sum(self, x, bwidth):  # ==========================================
         """
-        Sum data x over bins of width "bwidth" starting at indice 0 of x.
+        Sum data x over bins of width "bwidth" starting at indice 0 of x,
+        along its last axis.
         If there is residual data at the end because of the last bin being not
         complete, data are rejected and removed from the reshaped series.
         """
 
         bwidth = int(bwidth)
-        nbin = int(np.floor(len(x) / bwidth))
+        nbin = int(np.floor(x.shape[-1] / bwidth))
 
-        bheight = x[:nbin*bwidth].reshape(nbin, bwidth)
-        bheight = np.sum(bheight, axis=1)
+        bheight = x[..., :nbin*bwidth].reshape(x.shape[:-1] + (nbin, bwidth))
+        bheight = np.sum(bheight, axis=-1)
 
         return bheight
 
@@ -845,14 +954,18 @@ class Hydrograph(Figure):
         else:
             self.glue_plt.set_visible(True)
 
+        # The envelope is drawn as a single polygon that goes forward in
+        # time along the 95% water levels and back along the 5% ones.
         xlstime = self.gluedf['water levels']['time']
-        wl05 = self.gluedf['water levels']['predicted'][:, 0]/1000
-        wl95 = self.gluedf['water levels']['predicted'][:, 2]/1000
-
-        self.glue_plt.remove()
-        self.glue_plt = self.ax2.fill_between(
-            xlstime, wl95, wl05, facecolor='0.85', lw=1, edgecolor='0.65',
-            zorder=0)
+        predicted = self.gluedf['water levels']['predicted']
+        n = len(xlstime)
+        verts = np.empty((2 * n, 2))
+        verts[:n, 0] = xlstime
+        verts[n:, 0] = xlstime[::-1]
+        verts[:n, 1] = predicted[:, 2]
+        verts[n:, 1] = predicted[::-1, 0]
+        verts[:, 1] /= 1000
+        self.glue_plt.set_verts([verts])
 
     def draw_mrc_wl(self):
         """Draw the water levels predicted with the MRC."""
@@ -866,34 +979,47 @@ class Hydrograph(Figure):
     def draw_waterlvl(self):
         """
         This method is called the first time the graph is plotted and each
-        time water level datum is changed.
+        time water level datum, the time scale or the size of the figure
+        is changed.
         """
 
         # ---- Logger Measures
 
         time = self.wldset.xldates
         if self.WLdatum == 1:  # masl
-            water_lvl = self.wldset['Elevation']-self.wldset['WL']
+            water_lvl = self._wl_masl
         else:  # mbgs -> yaxis is inverted
-            water_lvl = self.wldset['WL']
+            water_lvl = self._wl_mbgs
 
         if self.trend_line == 1:
-            tfilt, wlfilt = filt_data(time, water_lvl, self.trend_MAW)
+            # The trend line is only computed again when the datum or the
+            # window of the moving average changed.
+            wlfilt_key = (self.WLdatum, self.trend_MAW)
+            if self._wlfilt is None or self._wlfilt[0] != wlfilt_key:
+                self._wlfilt = (
+                    wlfilt_key, filt_data(time, water_lvl, self.trend_MAW))
+            tfilt, wlfilt = self._wlfilt[1]
             self.l1_ax2.set_data(tfilt, wlfilt)
             self.l2_ax2.set_data(time, water_lvl)
 
         else:
-            self.l1_ax2.set_data(time, water_lvl)
+            # The water levels are downsampled to the resolution of the
+            # figure when saved at 300 dpi, which can never be finer than
+            # the width of the figure in pixels.
+            self.l1_ax2.set_data(*m4_downsample(
+                time, water_lvl, self.TIMEmin, self.TIMEmax,
+                int(self.fwidth * 300)))
             self.l2_ax2.set_data([], [])
 
         # ---- Manual Measures
 
-        time_wl_meas, wl_meas = self.wldset.get_wlmeas()
-        if len(wl_meas) > 0:
+        if len(self._wlmeas_time) > 0:
             if self.WLdatum == 1:
                 # The datum is meter above see level.
-                wl_meas = self.wldset['Elevation'] - wl_meas
-            self.h_WLmes.set_data(time_wl_meas, wl_meas)
+                wl_meas = self._wlmeas_masl
+            else:
+                wl_meas = self._wlmeas_mbgs
+            self.h_WLmes.set_data(self._wlmeas_time, wl_meas)
 
     def draw_weather(self):
         """
@@ -908,21 +1034,11 @@ class Hydrograph(Figure):
         # For performance purposes, only the data that fit within the limits
         # of the x axis limits are plotted.
 
-        istart = np.where(self.bTIME > self.TIMEmin)[0]
-        if len(istart) == 0:
-            istart = 0
-        else:
-            istart = istart[0]
-            if istart > 0:
-                istart += -1
-
-        iend = np.where(self.bTIME < self.TIMEmax)[0]
-        if len(iend) == 0:
-            iend = 0
-        else:
-            iend = iend[-1]
-            if iend < len(self.bTIME):
-                iend += 1
+        # The binned time is sorted, so the limits are found with a binary
+        # search. The last bin before the start of the time scale is kept.
+        istart = max(0, np.searchsorted(
+            self.bTIME, self.TIMEmin, side='right') - 1)
+        iend = np.searchsorted(self.bTIME, self.TIMEmax, side='left')
 
         time = self.bTIME[istart:iend]
         Tmax = self.bTMAX[istart:iend]
@@ -931,76 +1047,62 @@ class Hydrograph(Figure):
 
         # ------------------------------------------------------ PLOT PRECIP --
 
-        TIME2X = np.zeros(len(time) * 4)
-        Ptot2X = np.zeros(len(time) * 4)
-        Rain2X = np.zeros(len(time) * 4)
-
+        # The bars are drawn as the outline of a single polygon that starts
+        # and ends on the baseline, with four vertices per bar. The vertices
+        # are built by bar, so that each one is written in a single pass.
         n = self.bwidth / 2.
         f = 0.85  # Space between individual bar.
 
-        TIME2X[0::4] = time - n * f
-        TIME2X[1::4] = time - n * f
-        TIME2X[2::4] = time + n * f
-        TIME2X[3::4] = time + n * f
+        Ptot_verts = np.empty((len(time), 4, 2))
+        Ptot_verts[:, :, 0] = time[:, None] + np.array([-1, -1, 1, 1]) * n * f
+        Ptot_verts[:, 0::3, 1] = 0
+        Ptot_verts[:, 1:3, 1] = Ptot[:, None]
 
-        Ptot2X[0::4] = 0
-        Ptot2X[1::4] = Ptot
-        Ptot2X[2::4] = Ptot
-        Ptot2X[3::4] = 0
+        Rain_verts = Ptot_verts.copy()
+        Rain_verts[:, 1:3, 1] = Rain[:, None]
 
-        Rain2X[0::4] = 0
-        Rain2X[1::4] = Rain
-        Rain2X[2::4] = Rain
-        Rain2X[3::4] = 0
+        self.PTOT_bar.set_verts(
+            [Ptot_verts.reshape(-1, 2)] if len(time) else [])
+        self._ptot_max = np.nanmax(Ptot) if len(time) else None
+        self.PTOT_bar.set_facecolor(self.colorsDB.rgb['Snow'])
 
-        self.PTOT_bar.remove()
-        self.RAIN_bar.remove()
-
-        self.PTOT_bar = self.ax3.fill_between(TIME2X, 0., Ptot2X,
-                                              color=self.colorsDB.rgb['Snow'],
-                                              linewidth=0.0)
-
-        self.RAIN_bar = self.ax3.fill_between(TIME2X, 0., Rain2X,
-                                              color=self.colorsDB.rgb['Rain'],
-                                              linewidth=0.0)
+        self.RAIN_bar.set_verts(
+            [Rain_verts.reshape(-1, 2)] if len(time) else [])
+        self.RAIN_bar.set_facecolor(self.colorsDB.rgb['Rain'])
 
         self.baseline.set_data([self.TIMEmin, self.TIMEmax], [0, 0])
 
         # ---------------------------------------------------- PLOT AIR TEMP --
 
-        TIME2X = np.zeros(len(time)*2)
-        Tmax2X = np.zeros(len(time)*2)
-
-        n = self.bwidth / 2.
-        TIME2X[0:2*len(time)-1:2] = time - n
-        TIME2X[1:2*len(time):2] = time + n
-        Tmax2X[0:2*len(time)-1:2] = Tmax
-        Tmax2X[1:2*len(time):2] = Tmax
-
-        self.l1_ax4.remove()
-        self.l1_ax4 = self.ax4.fill_between(TIME2X, 0., Tmax2X,
-                                            color=self.colorsDB.rgb['Tair'],
-                                            edgecolor='None')
+        # The outline of the air temperature has two vertices per bin. The
+        # fill polygon also starts and ends on the zero line.
+        Tmax_verts = np.zeros((len(time) * 2 + 2, 2))
+        Tmax_outline = Tmax_verts[1:-1].reshape(len(time), 2, 2)
+        Tmax_outline[:, :, 0] = time[:, None] + np.array([-1, 1]) * n
+        Tmax_outline[:, :, 1] = Tmax[:, None]
+
+        if len(time):
+            Tmax_verts[0, 0] = Tmax_verts[1, 0]
+            Tmax_verts[-1, 0] = Tmax_verts[-2, 0]
+            self.l1_ax4.set_verts([Tmax_verts])
+        else:
+            self.l1_ax4.set_verts([])
+        self.l1_ax4.set_facecolor(self.colorsDB.rgb['Tair'])
 
-        self.l2_ax4.set_xdata(TIME2X)
-        self.l2_ax4.set_ydata(Tmax2X)
+        self.l2_ax4.set_data(Tmax_verts[1:-1, 0], Tmax_verts[1:-1, 1])
 
         self.update_precip_scale()
 
     def set_time_scale(self):
         """Setup the time scale of the x-axis."""
         if self.datemode.lower() == 'year':
-            year = xldate_as_tuple(self.TIMEmin, 0)[0]
-            self.TIMEmin = xldate_from_date_tuple((year, 1, 1), 0)
-
-            last_month = xldate_as_tuple(self.TIMEmax, 0)[1] == 1
-            last_day = xldate_as_tuple(self.TIMEmax, 0)[2] == 1
-
-            if last_month and last_day:
-                pass
-            else:
-                year = xldate_as_tuple(self.TIMEmax, 0)[0] + 1
-                self.TIMEmax = xldate_from_date_tuple((year, 1, 1), 0)
+            # Extend the time scale to the start of the years, unless the
+            # end of the time scale already falls on the first of January.
+            dates = xldates_to_datetime64([self.TIMEmin, self.TIMEmax])
+            years = dates.astype('datetime64[Y]')
+            if dates[1].astype('datetime64[D]') != years[1]:
+                years[1] += 1
+            self.TIMEmin, self.TIMEmax = datetime64_to_xldates(years)
 
         self.setup_xticklabels()
         self.ax1.axis([self.TIMEmin, self.TIMEmax, 0, self.NZGrid])
@@ -1012,17 +1114,35 @@ class Hydrograph(Figure):
         Note that labels are placed manually because this is around 25% faster
         than using the minor ticks.
         """
+        # The ticks and labels depend only on the time scale, the language
+        # and the size and position of the host axe, so they are not
+        # setup again when none of these changed.
+        xticks_key = (self.TIMEmin, self.TIMEmax, self.datemode.lower(),
+                      self.date_labels_pattern, self.language.lower(),
+                      tuple(self.get_size_inches()),
+                      self.ax1.get_position().bounds)
+        if xticks_key == self._xticks_key:
+            return
+        self._xticks_key = xticks_key
+
         xticks_info = self.make_xticks_info()
         self.ax1.set_xticks(xticks_info[0])
         self.ax1.set_xticks(xticks_info[3], minor=True)
 
-        for i in range(len(self.xlabels)):
-            self.xlabels[i].remove()
+        # The existing labels are reused and labels are only added or
+        # removed when the number of labels changed.
+        nlabels = len(xticks_info[1])
+        for label in self.xlabels[nlabels:]:
+            label.remove()
+        del self.xlabels[nlabels:]
 
-        padding = ScaledTranslation(0, -6/72, self.dpi_scale_trans)
+        for label, x, text in zip(
+                self.xlabels, xticks_info[1], xticks_info[2]):
+            label.set_position((x, 0))
+            label.set_text(text)
 
-        self.xlabels = []
-        for i in range(len(xticks_info[1])):
+        padding = ScaledTranslation(0, -6/72, self.dpi_scale_trans)
+        for i in range(len(self.xlabels), nlabels):
             new_label = self.ax1.text(
                 xticks_info[1][i], 0, xticks_info[2][i], rotation=45,
                 va='top', ha='right', fontsize=10,
@@ -1031,7 +1151,7 @@ class Hydrograph(Figure):
 
     def draw_figure_title(self):
         """Draw the title of the figure."""
-        labelDB = LabelDatabase(self.language)
+        labelDB = get_label_database(self.language.lower())
         if self.isGraphTitle:
             # Set the text and position of the title.
             if self.meteo_on:
@@ -1092,18 +1212,13 @@ class Hydrograph(Figure):
             return
 
         ymax = self.NZGrid * self.RAINscale
-        try:
-            p = self.PTOT_bar.get_paths()[0]
-            v = p.vertices
-            y = v[:, 1]
-
-            yticksmax = 0
-            while True:
-                if yticksmax > max(y):
-                    break
-                yticksmax += self.RAINscale
+        if self._ptot_max is not None and np.isfinite(self._ptot_max):
+            # The ticks go up to the first multiple of the scale that is
+            # above the highest precipitation bar.
+            yticksmax = self.RAINscale * (
+                np.floor(max(self._ptot_max, 0) / self.RAINscale) + 1)
             yticksmax = min(ymax, yticksmax) + self.RAINscale/2
-        except Exception:
+        else:
             yticksmax = 3.9 * self.RAINscale
 
         self.ax3.axis(ymin=0, ymax=ymax)
@@ -1175,42 +1290,33 @@ class Hydrograph(Figure):
 
         # Transform to data coord :
 
-        month_names = LabelDatabase(self.language).month_names
+        month_names = get_label_database(self.language.lower()).month_names
 
         xticks_labels_offset = sdx
 
-        xticks_labels = []
-        xticks_position = []
-        xticks_labels_position = []
-        xticks_minor_position = []
-
-        i = 0
-        next_xtick_pos = self.TIMEmin
-        while True:
-            datetuple = xldate_as_tuple(next_xtick_pos, 0)
-            year = datetuple[0]
-            month = datetuple[1]
-            month_range = monthrange(year, month)[1]
-
-            xticks_minor_position.append(next_xtick_pos)
-            if i % self.date_labels_pattern == 0:
-                xticks_position.append(next_xtick_pos)
-                xticks_labels_position.append(
-                    next_xtick_pos + xticks_labels_offset)
-                if self.datemode.lower() == 'month':
-                    xticks_labels.append("{} '{}".format(
-                        month_names[month - 1], str(year)[-2:]))
-                elif self.datemode.lower() == 'year':
-                    xticks_labels.append("%d" % year)
-
-            if self.datemode.lower() == 'month':
-                next_xtick_pos = next_xtick_pos + month_range
-            elif self.datemode.lower() == 'year':
-                next_xtick_pos = xldate_from_date_tuple((year + 1, 1, 1), 0)
-
-            if next_xtick_pos > self.TIMEmax:
-                break
-            i += 1
+        # Generate the dates of the ticks at once from the start of the
+        # time scale, and then on the first of each month or year.
+        time_start, time_end = xldates_to_datetimeindex(
+            [self.TIMEmin, self.TIMEmax])
+        datemode = self.datemode.lower()
+        freq = {'month': 'MS', 'year': 'AS'}[datemode]
+        xticks_dates = pd.date_range(time_start, time_end, freq=freq)
+        if not len(xticks_dates) or xticks_dates[0] != time_start:
+            xticks_dates = xticks_dates.insert(0, time_start)
+        xticks_minor_position = datetimeindex_to_xldates(xticks_dates)
+
+        xticks_dates = xticks_dates[::self.date_labels_pattern]
+        xticks_position = xticks_minor_position[::self.date_labels_pattern]
+        xticks_labels_position = xticks_position + xticks_labels_offset
+        # The years and months of the labels are read at once from the
+        # datetime index, instead of creating a Timestamp for each label.
+        if datemode == 'month':
+            xticks_labels = ["{} '{:02d}".format(month_names[month - 1],
+                                                 year % 100)
+                             for year, month in zip(xticks_dates.year,
+                                                    xticks_dates.month)]
+        elif datemode == 'year':
+            xticks_labels = ["%d" % year for year in xticks_dates.year]
 
         return (xticks_position, xticks_labels_position, xticks_labels,
                 xticks_minor_position)
@@ -1227,16 +1333,60 @@ def filt_data(time, waterlvl, N):
     waterlvl = np.interp(days, time[index_nonan], waterlvl[index_nonan])
 
     # Compute a centered moving average window on the daily resampled data.
-    # Based on the codes provided by StackOverflow user Alleo.
-    # https://stackoverflow.com/a/27681394/4481445
+    # The window is applied with a convolution rather than with a
+    # difference of cumulative sums, which loses precision on long records.
     N = int(N)
-    cumsum = np.cumsum(np.insert(waterlvl, 0, 0))
-    wlf = (cumsum[N:] - cumsum[:-N])/float(N)
     tf = days[N//2:-N//2+1]
+    wlf = np.convolve(waterlvl, np.ones(N) / N, mode='valid')[:len(tf)]
 
     return tf, wlf
 
 
+def m4_downsample(x, y, xmin, xmax, nbins):
+    """
+    Downsample the line defined by x and y with the M4 algorithm, so that it
+    is drawn identically when the interval from xmin to xmax spans nbins
+    pixels. The first, minimum, maximum and last points are kept for
+    each bin, in the order they occur. The data are returned unchanged if
+    this does not reduce their size. The x values must be sorted in
+    ascending order.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= 4 * nbins or xmax <= xmin:
+        return x, y
+
+    ibins = np.floor((x - xmin) / ((xmax - xmin) / nbins))
+    istart = np.hstack(([0], np.flatnonzero(np.diff(ibins)) + 1))
+    iend = np.hstack((istart[1:], [len(x)])) - 1
+
+    # The nan values are ignored when computing the extrema, so that the
+    # line is broken only where all the values of a bin are nan.
+    ymin = np.fmin.reduceat(y, istart)
+    ymax = np.fmax.reduceat(y, istart)
+
+    # Find the index of the first occurrence of the extrema in each bin.
+    # The first index of the bin is used for the bins that are all nan.
+    ibin = np.repeat(np.arange(len(istart)), iend - istart + 1)
+    indexes = np.arange(len(x))
+    imin = np.minimum.reduceat(
+        np.where(y == ymin[ibin], indexes, len(x)), istart)
+    imin = np.where(imin == len(x), istart, imin)
+    imax = np.minimum.reduceat(
+        np.where(y == ymax[ibin], indexes, len(x)), istart)
+    imax = np.where(imax == len(x), istart, imax)
+
+    # The extrema are kept in the order they occur in time.
+    im4 = np.empty((len(istart), 4), dtype=int)
+    im4[:, 0] = istart
+    im4[:, 1] = np.minimum(imin, imax)
+    im4[:, 2] = np.maximum(imin, imax)
+    im4[:, 3] = iend
+    im4 = im4.ravel()
+
+    return x[im4], y[im4]
+
+
 if __name__ == '__main__':
     from PyQt5.QtWidgets import QApplication
     import sys
@@ -66,6 +66,33 @@ def test_read_weather_datafile(filename):
     assert np.array_equal(expected_values, data.astype(str).values)
 
 
+def test_read_weather_datafile_short_rows(tmp_path):
+    """
+    Test that a csv weather data input file whose rows are shorter than
+    the header, including the first data row, is read as expected.
+    """
+    filename = osp.join(str(tmp_path), 'short_rows_weather_datafile.csv')
+    with open(filename, 'w') as csvfile:
+        csvfile.write(
+            "Station Name,MARIEVILLE\n"
+            "Year,Month,Day,Max Temp (deg C),Min Temp (deg C),"
+            "Mean Temp (deg C),Total Precip (mm),Other\n"
+            "2000,1,1,2,-12.8,-4.9\n"
+            "2000,1,2,,-6,1.5,6.8,2\n"
+            "2000,1,3,nan,-3.5,-0.5,6\n")
+    metadata, data = read_weather_datafile(filename)
+
+    assert data.columns.values.tolist() == ['Tmax', 'Tmin', 'Tavg', 'Ptot']
+    assert (data.index.strftime("%Y-%m-%d").values.tolist() ==
+            ['2000-01-01', '2000-01-02', '2000-01-03'])
+    expected_values = np.array(
+        [['2.0', '-12.8', '-4.9', 'nan'],
+         ['nan', '-6.0', '1.5', '6.8'],
+         ['nan', '-3.5', '-0.5', '6.0']
+         ])
+    assert np.array_equal(expected_values, data.astype(str).values)
+
+
 def test_init_wxdataframe_from_input_file():
     """
     Test that the WXDataFrame can be initiated properly from an input
@@ -143,6 +170,18 @@ def test_wxdata_monthly_yearly_values():
     assert round(yearly.loc[2001, 'Tavg'], 1) == 6.3
     assert round(yearly.loc[2001, 'Tmin'], 1) == 1.7
 
+    # Assert that the monthly and yearly values are cached and that
+    # modifying the returned values does not alter the cache.
+    monthly.insert(0, 'Year', monthly.index.get_level_values(0))
+    yearly.insert(0, 'Year', yearly.index)
+    assert 'Year' not in wxdset.get_monthly_values().columns
+    assert 'Year' not in wxdset.get_yearly_values().columns
+
+    # Assert that the cached values are cleared when new daily data are set.
+    wxdset.data = wxdset.data.loc['2001-01-01':'2001-01-31']
+    assert len(wxdset.get_monthly_values()) == 1
+    assert len(wxdset.get_yearly_values()) == 1
+
 
 def test_wxdata_monthly_yearly_normals():
     """
@@ -10,7 +10,7 @@
 
 # ---- Standard library imports
 import csv
-import datetime as dt
+import io
 import os
 import os.path as osp
 import re
@@ -64,6 +64,22 @@ class WXDataFrameBase(Mapping):
         self.missing_value_indexes = {
             var: pd.DatetimeIndex([]) for var in METEO_VARIABLES}
 
+    @property
+    def data(self):
+        """Return the daily weather data of this data frame."""
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        """
+        Set the daily weather data of this data frame and clear the cached
+        Excel dates, monthly and yearly values.
+        """
+        self._data = data
+        self._xldates = None
+        self._monthly_values = None
+        self._yearly_values = None
+
     @abstractmethod
     def __load_dataset__(self):
         """Loads the dataset and save it in a store."""
@@ -122,10 +138,16 @@ class WXDataFrameBase(Mapping):
         """
         Return a numpy array containing the Excel numerical dates
         corresponding to the dates of the dataset.
+
+        The dates are converted only once and the returned array is
+        read-only, since it is shared by all callers.
         """
-        timedeltas = self.data.index - xldate_as_datetime(4000, 0)
-        xldates = timedeltas.total_seconds() / (3600 * 24) + 4000
-        return xldates.values
+        if self._xldates is None:
+            timedeltas = self.data.index - xldate_as_datetime(4000, 0)
+            xldates = timedeltas.total_seconds() / (3600 * 24) + 4000
+            self._xldates = xldates.values
+            self._xldates.flags.writeable = False
+        return self._xldates
 
     # ---- utilities
     def strftime(self):
@@ -140,28 +162,38 @@ class WXDataFrameBase(Mapping):
         """
         Return the monthly mean or cummulative values for the weather
         variables saved in this data frame.
+
+        The values are computed from the daily data only once and are then
+        cached until new daily data are set.
         """
-        group = self.data.groupby(
-            [self.data.index.year, self.data.index.month])
-        df = pd.concat(
-            [group[['Ptot', 'Rain', 'Snow', 'PET']].sum(),
-             group[['Tmax', 'Tavg', 'Tmin']].mean()],
-            axis=1)
-        df.index.rename(['Year', 'Month'], inplace=True)
-        return df
+        if self._monthly_values is None:
+            group = self.data.groupby(
+                [self.data.index.year, self.data.index.month])
+            df = pd.concat(
+                [group[['Ptot', 'Rain', 'Snow', 'PET']].sum(),
+                 group[['Tmax', 'Tavg', 'Tmin']].mean()],
+                axis=1)
+            df.index.rename(['Year', 'Month'], inplace=True)
+            self._monthly_values = df
+        return self._monthly_values.copy()
 
     def get_yearly_values(self):
         """
         Return the yearly mean or cummulative values for the weather
         variables saved in this data frame.
+
+        The values are computed from the daily data only once and are then
+        cached until new daily data are set.
         """
-        group = self.data.groupby(self.data.index.year)
-        df = pd.concat(
-            [group[['Ptot', 'Rain', 'Snow', 'PET']].sum(),
-             group[['Tmax', 'Tavg', 'Tmin']].mean()],
-            axis=1)
-        df.index.rename('Year', inplace=True)
-        return df
+        if self._yearly_values is None:
+            group = self.data.groupby(self.data.index.year)
+            df = pd.concat(
+                [group[['Ptot', 'Rain', 'Snow', 'PET']].sum(),
+                 group[['Tmax', 'Tavg', 'Tmin']].mean()],
+                axis=1)
+            df.index.rename('Year', inplace=True)
+            self._yearly_values = df
+        return self._yearly_values.copy()
 
     # ---- Normals
     def get_monthly_normals(self, year_range=None):
@@ -296,8 +328,11 @@ def read_weather_datafile(filename):
     # Read the file.
     root, ext = osp.splitext(filename)
     if ext in ['.csv', '.out']:
+        # Only the header of the file is parsed with the csv module. The
+        # numerical data are parsed afterwards with the C engine of pandas.
         with open(filename, 'r') as csvfile:
-            data = list(csv.reader(csvfile, delimiter=','))
+            lines = csvfile.readlines()
+        data = csv.reader(lines, delimiter=',')
     elif ext in ['.xls', '.xlsx']:
         data = pd.read_excel(filename, dtype='str', header=None)
         data = data.values.tolist()
@@ -334,7 +369,14 @@ def read_weather_datafile(filename):
         raise ValueError("Cannot find the beginning of the data.")
 
     # Extract and format the numerical data from the file.
-    data = pd.DataFrame(data[i + 1:], columns=data[i])
+    if ext in ['.csv', '.out']:
+        data = pd.read_csv(
+            io.StringIO(''.join(lines[i + 1:])), header=None,
+            names=range(len(row)), usecols=range(len(row)),
+            index_col=False, engine='c')
+        data.columns = row
+    else:
+        data = pd.DataFrame(data[i + 1:], columns=row)
     data = data.replace(r'(?i)^\s*$|nan|none', np.nan, regex=True)
 
     # The data must contain the following columns :
@@ -396,23 +438,23 @@ def open_weather_log(fname):
     """
     for dlm in [',', '\t']:
         with open(fname, 'r') as f:
-            reader = list(csv.reader(f, delimiter=dlm))
-            if reader[0][0] == 'Station Name':
-                return reader[36:]
+            first_row = next(csv.reader(f, delimiter=dlm))
+        if first_row[0] == 'Station Name':
+            return pd.read_csv(
+                fname, delimiter=dlm, skiprows=36, header=None,
+                usecols=[0, 1, 2, 3], names=['Var', 'Year', 'Month', 'Day'],
+                skip_blank_lines=False, engine='c')
     else:
         return None
 
 
 def load_weather_log(fname, varname):
     reader = open_weather_log(fname)
-    datetimes = []
-    for i in range(len(reader)):
-        if reader[i][0] == varname:
-            year = int(float(reader[i][1]))
-            month = int(float(reader[i][2]))
-            day = int(float(reader[i][3]))
-            datetimes.append(dt.datetime(year, month, day))
-    return pd.DatetimeIndex(datetimes)
+    reader = reader[reader['Var'] == varname]
+    return pd.DatetimeIndex(pd.to_datetime(dict(
+        year=reader['Year'].astype(float).astype(int),
+        month=reader['Month'].astype(float).astype(int),
+        day=reader['Day'].astype(float).astype(int))))
 
 
 # ----- Base functions: secondary variables
@@ -9,12 +9,13 @@
 
 
 # ---- Standard Library imports
+from collections import OrderedDict
 import os
 import os.path as osp
 
 # ---- Third party imports
 import numpy as np
-from PyQt5.QtCore import Qt, QCoreApplication
+from PyQt5.QtCore import Qt
 from PyQt5.QtCore import pyqtSignal as QSignal
 from PyQt5.QtWidgets import (
     QWidget, QCheckBox, QComboBox, QGridLayout, QLabel, QMessageBox,
@@ -27,6 +28,7 @@ from gwhat.config.ospath import (
 from gwhat.meteo.weather_viewer import WeatherViewer, ExportWeatherButton
 from gwhat.utils.icons import QToolButtonSmall
 from gwhat.utils import icons
+from gwhat.utils.qthelpers import process_qt_events
 import gwhat.common.widgets as myqt
 from gwhat.common.utils import calc_dist_from_coord
 from gwhat.projet.reader_waterlvl import WLDataFrame
@@ -36,6 +38,11 @@ from gwhat.widgets.buttons import ToolBarWidget
 from gwhat.widgets.spinboxes import StrSpinBox
 
 
+# The maximum number of weather datasets that are kept in memory by the
+# data manager after they were read from the project file.
+WXDSETS_CACHE_SIZE = 8
+
+
 class DataManager(QWidget):
 
     wldsetChanged = QSignal(object)
@@ -50,6 +57,7 @@ class DataManager(QWidget):
 
         self._wldset = None
         self._wxdset = None
+        self._wxdsets_cache = OrderedDict()
 
         self.setWindowFlags(Qt.Window)
         self.setWindowIcon(icons.get_icon('master'))
@@ -185,6 +193,7 @@ class DataManager(QWidget):
         self._projet = projet
         self._wldset = None
         self._wxdset = None
+        self._wxdsets_cache.clear()
         if projet is not None:
             self.update_wldsets(projet.get_last_opened_wldset())
             self.update_wxdsets(projet.get_last_opened_wxdset())
@@ -384,6 +393,8 @@ class DataManager(QWidget):
         update the GUI.
         """
         print("Saving the new weather dataset in the project.", end=" ")
+        self._wxdset = None
+        self._wxdsets_cache.pop(name, None)
         self.projet.add_wxdset(name, dataset)
         self.update_wxdsets(name)
         self.wxdset_changed()
@@ -430,6 +441,7 @@ class DataManager(QWidget):
                 elif reply == QMessageBox.Yes:
                     self._confirm_before_deleting_dset = dont_show_again
             self._wxdset = None
+            self._wxdsets_cache.pop(dsetname, None)
             self.projet.del_wxdset(dsetname)
             self.update_wxdsets()
             self.wxdset_changed()
@@ -444,9 +456,27 @@ class DataManager(QWidget):
         else:
             cbox_text = self.wxdsets_cbox.currentText()
             if self._wxdset is None or self._wxdset.name != cbox_text:
-                self._wxdset = self.projet.get_wxdset(cbox_text)
+                self._wxdset = self._get_cached_wxdset(cbox_text)
         return self._wxdset
 
+    def _get_cached_wxdset(self, name):
+        """
+        Return the weather dataset corresponding to the provided name,
+        reading it from the project file only if it is not already
+        in the cache of the recently used weather datasets.
+        """
+        if name in self._wxdsets_cache:
+            self._wxdsets_cache.move_to_end(name)
+            self.projet.set_last_opened_wxdset(name)
+            return self._wxdsets_cache[name]
+
+        wxdset = self.projet.get_wxdset(name)
+        if wxdset is not None:
+            self._wxdsets_cache[name] = wxdset
+            if len(self._wxdsets_cache) > WXDSETS_CACHE_SIZE:
+                self._wxdsets_cache.popitem(last=False)
+        return wxdset
+
     def set_current_wxdset(self, name):
         """Set the current weather dataset from its name."""
         self.wxdsets_cbox.blockSignals(True)
@@ -702,8 +732,7 @@ class NewDatasetDialog(QDialog):
         QApplication.setOverrideCursor(Qt.WaitCursor)
         self.ConsoleSignal.emit(
             "<font color=black>Loading %s data...</font>" % self._datatype)
-        for i in range(5):
-            QCoreApplication.processEvents()
+        process_qt_events()
 
         try:
             if self._datatype == 'water level':
@@ -20,7 +20,7 @@ from appconfigs.base import get_home_dir
 from PyQt5.QtCore import pyqtSignal as QSignal
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtWidgets import (
-    QWidget, QLabel, QDesktopWidget, QPushButton, QApplication, QGridLayout,
+    QWidget, QLabel, QPushButton, QApplication, QGridLayout,
     QMessageBox, QDialog, QLineEdit, QToolButton, QFileDialog)
 
 # ---- Local imports
@@ -192,7 +192,7 @@ class ProjetManager(QWidget):
                     self.close_projet()
                     return False
 
-        init_waterlvl_measures(osp.join(self.projet.dirname, "Water Levels"))
+        init_waterlvl_measures(self.projet.waterlvl_dirname)
         self.project_selector.add_recent_project(self.projet.filename)
         self.project_selector.set_current_project(self.projet.filename)
         self.project_selector.adjustSize()
@@ -489,7 +489,7 @@ class NewProject(QDialog):
             hp = self.parentWidget().frameGeometry().height()
             cp = self.parentWidget().mapToGlobal(QPoint(wp/2., hp/2.))
         else:
-            cp = QDesktopWidget().availableGeometry().center()
+            cp = QApplication.desktop().availableGeometry().center()
         qr.moveCenter(cp)
         self.move(qr.topLeft())
         self.setFixedSize(self.size())
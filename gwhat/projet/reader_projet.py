@@ -51,6 +51,14 @@ class ProjetReader(object):
     def dirname(self):
         return os.path.dirname(self.filename)
 
+    @property
+    def waterlvl_dirname(self):
+        """
+        Return the path of the folder where the water level resource files
+        of the project, like the manual measurements, are saved.
+        """
+        return osp.join(self.dirname, "Water Levels")
+
     def load_projet(self, filename):
         """Open the hdf5 project file."""
         self.close()
@@ -403,15 +411,15 @@ class WLDataFrameHDF5(WLDataFrameBase):
         self.dset = hdf5group
         self._undo_stack = []
 
-        columns = []
-        data = []
+        # Read each column from the hdf5 file in a single call and keep
+        # it in its native dtype, so that the numeric data do not need to
+        # be stacked with the time strings in an object array.
+        data = {}
         for colname in ['Time', 'WL', 'BP', 'ET']:
-            if len(self.dset[colname][...]):
-                data.append(self.dset[colname][...])
-                columns.append(colname)
-        data = np.vstack(tuple(data)).transpose()
-        columns = tuple(columns)
-        self._dataf = WLDataset(data, columns)
+            values = self.dset[colname][...]
+            if len(values):
+                data[colname] = values
+        self._dataf = WLDataset(data, tuple(data.keys()))
 
         # Setup the structure for the Master Recession Curve
         if 'mrc' not in list(self.dset.keys()):
@@ -475,7 +483,7 @@ class WLDataFrameHDF5(WLDataFrameBase):
             self.dset.file.flush()
 
     def __getitem__(self, key):
-        if key in list(self.dset.attrs.keys()):
+        if key in self.dset.attrs:
             return self.dset.attrs[key]
         else:
             return self.dset[key][...]
@@ -817,22 +825,26 @@ class WLDataFrameHDF5(WLDataFrameBase):
 
     def get_layout(self):
         """Return the layout dict that is saved in the project hdf5 file."""
-        if 'TIMEmin' not in self.dset['layout'].attrs.keys():
+        grp = self.dset['layout']
+        attrs = grp.attrs
+        if 'TIMEmin' not in attrs:
             return None
+
+        # The attributes are read in a single pass over the group instead
+        # of looking up each of them by name.
         layout = {}
-        for key in list(self.dset['layout'].attrs.keys()):
-            layout[key] = self.dset['layout'].attrs[key]
-            if layout[key] == '__None__':
-                layout[key] = None
-            elif layout[key] == '__True__':
-                layout[key] = True
-            elif layout[key] == '__False__':
-                layout[key] = False
-
-        layout['colors'] = {}
-        grp_colors = self.dset['layout'].require_group('colors')
-        for key in list(grp_colors.attrs.keys()):
-            layout['colors'][key] = grp_colors.attrs[key].tolist()
+        for key, value in attrs.items():
+            if value == '__None__':
+                value = None
+            elif value == '__True__':
+                value = True
+            elif value == '__False__':
+                value = False
+            layout[key] = value
+
+        grp_colors = grp.require_group('colors')
+        layout['colors'] = {
+            key: value.tolist() for key, value in grp_colors.attrs.items()}
 
         keys = list(layout.keys())
         if 'meteo_on' not in keys:
@@ -944,14 +956,16 @@ class WXDataFrameHDF5(WXDataFrameBase):
         for key in dataset.attrs.keys():
             self.metadata[key] = dataset.attrs[key]
 
-        # Get and format the timeseries data.
+        # Get and format the timeseries data. Each variable is read from
+        # the hdf5 file in a single call and the dataframe is built at once
+        # instead of being filled one column at a time.
         self.data = pd.DataFrame(
-            [],
+            {variable: dataset[variable][...] for
+             variable in METEO_VARIABLES},
             columns=METEO_VARIABLES,
-            index=pd.to_datetime(dataset['Time'], infer_datetime_format=True)
+            index=pd.to_datetime(
+                dataset['Time'][...], format="%Y-%m-%dT%H:%M:%S")
             )
-        for variable in METEO_VARIABLES:
-            self.data[variable] = np.copy(dataset[variable])
 
         # Get and format the missing value time indexes.
         self.missing_value_indexes = {}
@@ -959,7 +973,7 @@ class WXDataFrameHDF5(WXDataFrameBase):
             key = 'Missing {}'.format(variable)
             if key in dataset.keys():
                 self.missing_value_indexes[variable] = pd.to_datetime(
-                    dataset[key][:], infer_datetime_format=True)
+                    dataset[key][...], format="%Y-%m-%dT%H:%M:%S")
 
     @property
     def name(self):
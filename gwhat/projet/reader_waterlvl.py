@@ -8,7 +8,7 @@
 
 
 # ---- Standard library imports
-from copy import deepcopy
+import io
 import re
 import os
 import os.path as osp
@@ -25,6 +25,7 @@ from xlrd import xldate_as_tuple
 
 # ---- Local library imports
 from gwhat.common.utils import save_content_to_csv
+from gwhat.utils.dates import xldates_to_datetimeindex
 
 FILE_EXTS = ['.csv', '.xls', '.xlsx']
 
@@ -90,9 +91,8 @@ class WLDataset(EmptyWLDataset):
             try:
                 # We assume first that the dates are stored in the
                 # Excel numeric format.
-                datetimes = self['Time'].astype('float64', errors='raise')
-                datetimes = pd.to_datetime(datetimes.apply(
-                    lambda date: xlrd.xldate.xldate_as_datetime(date, 0)))
+                datetimes = xldates_to_datetimeindex(
+                    self['Time'].astype('float64', errors='raise').values)
             except ValueError:
                 try:
                     # Try converting the strings to datetime objects.
@@ -125,8 +125,11 @@ def open_water_level_datafile(filename):
               osp.basename(filename))
 
     if ext == '.csv':
+        # Only the lines of the file are read here. The header is parsed
+        # lazily with the csv module, while the numerical data are parsed
+        # with the C engine of pandas (see read_water_level_datafile).
         with open(filename, 'r', encoding='utf8') as f:
-            data = list(csv.reader(f, delimiter=','))
+            data = f.readlines()
     elif ext in ['.xls', '.xlsx']:
         with xlrd.open_workbook(filename, on_demand=True) as wb:
             sheet = wb.sheet_by_index(0)
@@ -143,10 +146,12 @@ def read_water_level_datafile(filename):
     """
     if filename is None or not osp.exists(filename):
         return None
-    reader = open_water_level_datafile(filename)
+    data = open_water_level_datafile(filename)
+    is_csv = osp.splitext(filename)[1] == '.csv'
+    reader = csv.reader(data, delimiter=',') if is_csv else data
 
     # Fetch the metadata from the header.
-    header = deepcopy(HEADER)
+    header = HEADER.copy()
     for i, row in enumerate(reader):
         if not len(row):
             continue
@@ -169,7 +174,14 @@ def read_water_level_datafile(filename):
         return None
 
     # Cast the data into a Pandas dataframe.
-    dataf = WLDataset(reader[i+1:], columns=row)
+    if is_csv:
+        data = pd.read_csv(
+            io.StringIO(''.join(data[i+1:])), header=None,
+            names=range(len(row)), usecols=range(len(row)),
+            index_col=False, engine='c').values
+    else:
+        data = data[i+1:]
+    dataf = WLDataset(data, columns=row)
 
     # Add the metadata to the dataframe.
     for key in header.keys():
@@ -185,17 +197,19 @@ def init_waterlvl_measures(dirname):
     Create an empty waterlvl_manual_measurements.csv file with headers
     if it does not already exist.
     """
-    for ext in FILE_EXTS:
+    for ext in ['.xls', '.xlsx']:
         fname = os.path.join(dirname, "waterlvl_manual_measurements" + ext)
         if os.path.exists(fname):
             return
-    else:
-        fname = os.path.join(dirname, 'waterlvl_manual_measurements.csv')
-        fcontent = [['Well_ID', 'Time (days)', 'Obs. (mbgs)']]
 
-        if not os.path.exists(dirname):
-            os.makedirs(dirname)
-        save_content_to_csv(fname, fcontent)
+    # The csv file is opened in exclusive creation mode, so that checking
+    # whether it already exists and creating it is done in a single call.
+    fname = os.path.join(dirname, 'waterlvl_manual_measurements.csv')
+    fcontent = [['Well_ID', 'Time (days)', 'Obs. (mbgs)']]
+    try:
+        save_content_to_csv(fname, fcontent, mode='x')
+    except FileExistsError:
+        pass
 
 
 def load_waterlvl_measures(filename, well):
@@ -221,13 +235,12 @@ def load_waterlvl_measures(filename, well):
 
     # Open and read the file.
     if ext == '.csv':
-        with open(filename, 'r') as f:
-            reader = np.array(list(csv.reader(f, delimiter=',')))
-            data = np.array(reader[1:])
+        data = pd.read_csv(filename, usecols=[0, 1, 2], dtype={0: 'str'},
+                           engine='c')
 
-            well_name = np.array(data[:, 0]).astype('str')
-            time = np.array(data[:, 1]).astype('float')
-            wl = np.array(data[:, 2]).astype('float')
+        well_name = data.iloc[:, 0].values.astype('str')
+        time = data.iloc[:, 1].values.astype('float')
+        wl = data.iloc[:, 2].values.astype('float')
 
     elif ext in ['.xlsx', '.xls']:
         with xlrd.open_workbook(filename) as wb:
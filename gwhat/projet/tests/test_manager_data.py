@@ -123,6 +123,36 @@ def test_delete_weather_data(datamanager, mocker, qtbot):
     assert mock_exec_.call_count == 2
 
 
+def test_weather_datasets_cache(datamanager, mocker, qtbot):
+    """
+    Test that weather datasets that were recently selected are not read
+    again from the project file.
+    """
+    datamanager.new_wxdset_imported('wxdset1', WXDataFrame(WXFILENAME))
+    datamanager.new_wxdset_imported('wxdset2', WXDataFrame(WXFILENAME))
+    wxdset2 = datamanager.get_current_wxdset()
+
+    datamanager.set_current_wxdset('wxdset1')
+    wxdset1 = datamanager.get_current_wxdset()
+    assert wxdset1.name == 'wxdset1'
+
+    # Switch back and forth between the two weather datasets.
+    mock_get_wxdset = mocker.spy(datamanager.projet, 'get_wxdset')
+    datamanager.set_current_wxdset('wxdset2')
+    assert datamanager.get_current_wxdset() is wxdset2
+    assert datamanager.projet.get_last_opened_wxdset() == 'wxdset2'
+    datamanager.set_current_wxdset('wxdset1')
+    assert datamanager.get_current_wxdset() is wxdset1
+    assert datamanager.projet.get_last_opened_wxdset() == 'wxdset1'
+    assert mock_get_wxdset.call_count == 0
+
+    # Replace a weather dataset and assert the cache was updated.
+    datamanager.projet.del_wxdset('wxdset2')
+    datamanager.new_wxdset_imported('wxdset2', WXDataFrame(WXFILENAME))
+    assert datamanager.get_current_wxdset() is not wxdset2
+    assert mock_get_wxdset.call_count == 1
+
+
 def test_import_waterlevel_data(datamanager, mocker, qtbot):
     """
     Test that importing water level data in gwhat projects is
@@ -12,6 +12,7 @@ import os
 import os.path as osp
 
 # ---- Third Party Libraries Imports
+import numpy as np
 import pytest
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
@@ -24,6 +25,7 @@ from gwhat.HydroPrint2 import (HydroprintGUI, PageSetupWin, QFileDialog,
                                QMessageBox)
 from gwhat.projet.manager_data import DataManager
 from gwhat.projet.reader_projet import ProjetReader
+from gwhat.hydrograph4 import m4_downsample
 
 DATADIR = osp.join(osp.dirname(osp.realpath(__file__)), 'data')
 WXFILENAMES = (
@@ -130,6 +132,29 @@ def test_zoomin_zoomout(hydroprint):
         hydroprint.zoom_out()
 
 
+def test_layout_changed_rendering(hydroprint, mocker, qtbot):
+    """
+    Test that a burst of changes to the layout of the hydrograph results in
+    a single update and rendering of the figure in the viewer.
+    """
+    load_mpl_figure = mocker.spy(
+        hydroprint.hydrograph_scrollarea, 'load_mpl_figure')
+    setup_waterlvl_scale = mocker.spy(
+        hydroprint.hydrograph, 'setup_waterlvl_scale')
+    for value in [0.3, 0.35, 0.4]:
+        hydroprint.waterlvl_scale.setValue(value)
+    hydroprint.NZGridWL_spinBox.setValue(10)
+    assert load_mpl_figure.call_count == 0
+    assert setup_waterlvl_scale.call_count == 0
+
+    qtbot.waitUntil(lambda: load_mpl_figure.call_count == 1)
+    qtbot.wait(300)
+    assert load_mpl_figure.call_count == 1
+    assert setup_waterlvl_scale.call_count == 2
+    assert hydroprint.hydrograph.WLscale == 0.4
+    assert hydroprint.hydrograph.NZGrid == 10
+
+
 @pytest.mark.parametrize('fext', ['.png', '.pdf', '.svg'])
 def test_save_hydrograph_fig(hydroprint, mocker, qtbot, fext, tmp_path):
     """
@@ -141,21 +166,28 @@ def test_save_hydrograph_fig(hydroprint, mocker, qtbot, fext, tmp_path):
         QFileDialog,
         'getSaveFileName',
         return_value=(fname, '*{}'.format(fext)))
-    qtbot.mouseClick(hydroprint.btn_save, Qt.LeftButton)
-    qtbot.waitUntil(lambda: osp.exists(fname))
+    with qtbot.waitSignal(hydroprint.figure_saver.sig_file_saved):
+        qtbot.mouseClick(hydroprint.btn_save, Qt.LeftButton)
+    assert osp.exists(fname)
 
 
-def test_copy_to_clipboard(hydroprint, qtbot):
+def test_copy_to_clipboard(hydroprint, mocker, qtbot):
     """
     Test that puting a copy of the hydrograph figure on the clipboard is
     working as expected.
     """
+    generate_hydrograph = mocker.spy(hydroprint.hydrograph,
+                                     'generate_hydrograph')
     QApplication.clipboard().clear()
     assert QApplication.clipboard().text() == ''
     assert QApplication.clipboard().image().isNull()
     qtbot.mouseClick(hydroprint.btn_copy_to_clipboard, Qt.LeftButton)
     assert not QApplication.clipboard().image().isNull()
 
+    # Assert that the hydrograph was not generated again since it was
+    # already up to date.
+    assert generate_hydrograph.call_count == 0
+
 
 def test_graph_layout(hydroprint, mocker, qtbot):
     """Test saving and loading hydrograph layout to and from the project."""
@@ -234,6 +266,36 @@ def test_clear_hydrograph(hydroprint, mocker, tmp_path):
     assert hydroprint.hydrograph.isHydrographExists is False
 
 
+def test_m4_downsample():
+    """
+    Test that the M4 downsampling keeps the first, minimum, maximum and
+    last points of each bin in time order and the gaps in the data.
+    """
+    x = np.arange(1000) / 10
+    y = np.sin(x)
+    y[500:700] = np.nan
+
+    xm4, ym4 = m4_downsample(x, y, 0, 100, 10)
+    assert len(xm4) == len(ym4) == 4 * 10
+    assert np.all(np.diff(xm4) >= 0)
+    for i in range(10):
+        xbin = x[i * 100:(i + 1) * 100]
+        ybin = y[i * 100:(i + 1) * 100]
+        if np.all(np.isnan(ybin)):
+            assert np.all(np.isnan(ym4[i * 4:(i + 1) * 4]))
+        else:
+            iextrema = sorted([np.nanargmin(ybin), np.nanargmax(ybin)])
+            assert list(xm4[i * 4 + 1:i * 4 + 3]) == list(xbin[iextrema])
+            assert list(ym4[i * 4 + 1:i * 4 + 3]) == list(ybin[iextrema])
+        assert xm4[i * 4] == x[i * 100]
+        assert xm4[i * 4 + 3] == x[(i + 1) * 100 - 1]
+
+    # The data must be returned unchanged if they are not dense enough.
+    xm4, ym4 = m4_downsample(x, y, 0, 100, 1000)
+    assert xm4 is x
+    assert ym4 is y
+
+
 # ---- Test PageSetupWin
 def test_pagesetup_defaults(pagesetup):
     """Assert that the default values are as expected."""
@@ -304,8 +366,13 @@ def test_pagesetup_ok(pagesetup, qtbot):
     pagesetup.title_on.set_value(False)
     pagesetup.meteo_on.set_value(False)
 
-    # Assert that the values are updated correctly when clicking the button OK.
-    qtbot.mouseClick(pagesetup.btn_OK, Qt.LeftButton)
+    # Assert that the values are updated correctly when clicking the button OK
+    # and that only the settings that changed are sent.
+    with qtbot.waitSignal(pagesetup.newPageSetupSent) as blocker:
+        qtbot.mouseClick(pagesetup.btn_OK, Qt.LeftButton)
+    assert sorted(blocker.args[0]) == sorted(
+        ['pageSize', 'va_ratio', 'isLegend', 'isTrendLine', 'isGraphTitle',
+         'is_meteo_on'])
     assert pagesetup.fwidth.value() == 12.5
     assert pagesetup.pageSize[0] == 12.5
 
@@ -12,11 +12,15 @@
 import h5py
 import numpy as np
 import pandas as pd
-import xlrd
 from xlrd import xldate_as_tuple
 from xlrd.xldate import xldate_as_datetime
 from PyQt5.QtCore import QDate, QDateTime
 
+# The origins of the Excel numeric date format for workbooks created on
+# Windows (1900-based, datemode=0) and on macOS (1904-based, datemode=1).
+XLDATE_ORIGINS = {0: np.datetime64('1899-12-30'),
+                  1: np.datetime64('1904-01-01')}
+
 
 def format_time_data(self, timedata):
     """
@@ -40,8 +44,7 @@ def format_time_data(self, timedata):
         try:
             # Try converting the Excel numeric dates to pandas
             # datetime objects.
-            datetimes = pd.to_datetime(datetimes.apply(
-                lambda date: xlrd.xldate.xldate_as_datetime(date, 0)))
+            datetimes = xldates_to_datetimeindex(timedata)
         except Exception:
             print('Warning: the dates are not formatted correctly.')
     return datetimes
@@ -56,13 +59,34 @@ def datetimeindex_to_xldates(datetimeindex):
     return xldates.values
 
 
+def datetime64_to_xldates(dates, datemode=0):
+    """
+    Convert an array of numpy datetime64 into a numpy array of Excel
+    numeric dates.
+    """
+    return ((np.asarray(dates, dtype='datetime64[ms]') -
+             XLDATE_ORIGINS[datemode]) / np.timedelta64(1, 'D'))
+
+
+def xldates_to_datetime64(xldates, datemode=0):
+    """
+    Convert a numpy array of Excel numeric dates into an array of numpy
+    datetime64, rounded to the nearest millisecond.
+    """
+    xldates = np.asarray(xldates, dtype='float64')
+    days = np.floor(xldates)
+    # The fraction of the day is rounded separately from the number of days,
+    # as it is done in xlrd, to get exactly the same datetimes.
+    timedeltas = days * 86400000 + np.round((xldates - days) * 86400000)
+    return XLDATE_ORIGINS[datemode] + timedeltas.astype('timedelta64[ms]')
+
+
 def xldates_to_datetimeindex(xldates):
     """
     Format a list or numpy array of Excel numeric dates into a
     pandas datetime index.
     """
-    return pd.to_datetime(
-        [xlrd.xldate.xldate_as_datetime(xldate, 0) for xldate in xldates])
+    return pd.DatetimeIndex(xldates_to_datetime64(xldates))
 
 
 def xldates_to_strftimes(xldates):
@@ -84,8 +108,18 @@ def qdate_from_xldate(xldate, datemode=0):
     A value of 0 is used of the workbook was created in Windows (1900-based),
     while a value of 1 is used if it was created on macOS (1904-based).
     """
-    date_tuple = xldate_as_tuple(xldate, datemode)
-    return QDate(date_tuple[0], date_tuple[1], date_tuple[2])
+    return QDate(xldates_to_datetime64(xldate, datemode).astype(object))
+
+
+def xldate_from_qdate(qdate, datemode=0):
+    """
+    Convert a QDate object to a numerical Excel date.
+
+    A value of 0 is used of the workbook was created in Windows (1900-based),
+    while a value of 1 is used if it was created on macOS (1904-based).
+    """
+    return float(datetime64_to_xldates(
+        np.datetime64(qdate.toPyDate()), datemode))
 
 
 def qdatetime_from_xldate(xldate, datemode=0):
@@ -8,6 +8,7 @@
 # -----------------------------------------------------------------------------
 
 # ---- Standard library imports
+from functools import lru_cache
 import os
 
 # ---- Third party imports
@@ -171,8 +172,14 @@ ICON_SIZES = {'large': (32, 32),
               'small': (20, 20)}
 
 
+@lru_cache(maxsize=None)
 def get_icon(name):
-    """Return a QIcon from a specified icon name."""
+    """
+    Return a QIcon from a specified icon name.
+
+    The icons are cached, so that the image files are read and the font
+    icons are rendered only once for each name.
+    """
     if name in FA_ICONS:
         args, kwargs = FA_ICONS[name]
         return qta.icon(*args, **kwargs)
@@ -53,11 +53,8 @@ def nan_as_text_tolist(arr):
     Convert the float nan to text while converting a numpy 2d array to a
     list, so that it is possible to save to an Excel file.
     """
-    if np.isnan(arr).any():
-        m, n = np.shape(arr)
-        list_ = []
-        for i in range(m):
-            list_.append(['nan' if np.isnan(x) else x for x in arr[i, :]])
-    else:
-        list_ = arr.tolist()
-    return list_
+    isnan = np.isnan(arr)
+    if isnan.any():
+        arr = np.asarray(arr).astype(object)
+        arr[isnan] = 'nan'
+    return arr.tolist()
@@ -14,7 +14,10 @@ import sys
 import platform
 
 # ---- Third party imports
-from PyQt5.QtCore import QByteArray, Qt, QSize
+from PyQt5.QtCore import (
+    QByteArray, Qt, QSize, QEventLoop, QObject, QThread)
+from PyQt5.QtCore import pyqtSignal as QSignal
+from PyQt5.QtCore import pyqtSlot as QSlot
 from PyQt5.QtWidgets import (
     QWidget, QSizePolicy, QToolButton, QApplication, QStyleFactory)
 
@@ -50,6 +53,100 @@ def create_qapplication():
     return qapp
 
 
+def process_qt_events(maxtime=10):
+    """
+    Process the pending events of the Qt event loop, excluding user input
+    events, for at most maxtime milliseconds.
+
+    This is used to let the UI refresh before a blocking operation without
+    dispatching user inputs, which could re-enter the calling code.
+    """
+    QApplication.processEvents(QEventLoop.ExcludeUserInputEvents, maxtime)
+
+
+class SaveFileWorker(QObject):
+    """
+    A worker to save a file with a callable from a separate thread.
+    """
+    sig_finished = QSignal(int, str, object)
+
+    def __init__(self):
+        super().__init__()
+        self.run_id = 0
+        self.save_func = None
+        self.fname = None
+
+    def save_file(self):
+        """
+        Call the save function with the file name and emit the id of the
+        run, the file name and the error that was raised, if any.
+        """
+        try:
+            self.save_func(self.fname)
+        except Exception as error:
+            self.sig_finished.emit(self.run_id, self.fname, error)
+        else:
+            self.sig_finished.emit(self.run_id, self.fname, None)
+        finally:
+            self.save_func = None
+
+
+class FileSaver(QObject):
+    """
+    Save files with a callable in a separate thread, so that the GUI does
+    not freeze while large files are written.
+
+    The wait cursor is shown until the last save has finished. Only the
+    outcome of the last save is signaled, the results of previous saves
+    that are still queued when a new save is started are ignored.
+    """
+    sig_file_saved = QSignal(str)
+    sig_save_error = QSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._run_id = 0
+        self._saving = False
+        self.worker = SaveFileWorker()
+        self.worker.sig_finished.connect(self._handle_save_finished)
+        self.thread = QThread()
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.save_file)
+
+    def save(self, save_func, fname):
+        """
+        Save the file by calling save_func with fname in a separate thread,
+        after the previous file, if any, was saved.
+        """
+        self.wait()
+        if not self._saving:
+            self._saving = True
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._run_id += 1
+        self.worker.run_id = self._run_id
+        self.worker.save_func = save_func
+        self.worker.fname = fname
+        self.thread.start()
+
+    def wait(self):
+        """Wait for the file that is being saved, if any, to be saved."""
+        self.thread.quit()
+        self.thread.wait()
+
+    @QSlot(int, str, object)
+    def _handle_save_finished(self, run_id, fname, error):
+        """Handle when the worker has finished saving a file."""
+        if run_id != self._run_id:
+            return
+        self.thread.quit()
+        self._saving = False
+        QApplication.restoreOverrideCursor()
+        if error is None:
+            self.sig_file_saved.emit(fname)
+        else:
+            self.sig_save_error.emit(fname, error)
+
+
 def create_toolbar_stretcher():
     """Create a stretcher to be used in a toolbar """
     stretcher = QWidget()
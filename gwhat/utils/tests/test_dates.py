@@ -10,10 +10,15 @@
 import os
 
 # ---- Third party imports
+import numpy as np
 import pytest
+from PyQt5.QtCore import QDate
+from xlrd.xldate import xldate_as_datetime
 
 # ---- Local imports
-from gwhat.utils.dates import qdate_from_xldate
+from gwhat.utils.dates import (
+    qdate_from_xldate, xldate_from_qdate, datetime64_to_xldates,
+    xldates_to_datetime64, xldates_to_datetimeindex)
 
 
 # ---- Tests
@@ -29,5 +34,37 @@ def test_qdate_from_xldate():
         assert qdate.year() == 2017
 
 
+def test_xldate_from_qdate():
+    """
+    Assert that the function to convert a QDate object to a numerical Excel
+    date is working as expected.
+    """
+    assert xldate_from_qdate(QDate(2017, 9, 22)) == 43000
+    assert xldate_from_qdate(QDate(2017, 9, 22), datemode=1) == 41538
+
+
+def test_datetime64_xldates_roundtrip():
+    """
+    Assert that the vectorized conversions between numpy datetime64 and
+    numerical Excel dates are working as expected.
+    """
+    dates = np.array(['2000-01-01', '2012-11-28T16:45', '2017-09-22'],
+                     dtype='datetime64[ms]')
+    xldates = datetime64_to_xldates(dates)
+    assert np.allclose(xldates, [36526, 41241.697916666664, 43000])
+    assert np.all(xldates_to_datetime64(xldates) == dates)
+
+
+def test_xldates_to_datetimeindex():
+    """
+    Assert that the vectorized conversion of numerical Excel dates to a
+    pandas datetime index gives the same results as xlrd.
+    """
+    xldates = np.arange(43000, 43001, 1/96)
+    datetimeindex = xldates_to_datetimeindex(xldates)
+    expected = [xldate_as_datetime(xldate, 0) for xldate in xldates]
+    assert list(datetimeindex.to_pydatetime()) == expected
+
+
 if __name__ == "__main__":
     pytest.main(['-x', os.path.basename(__file__), '-v', '-rw'])
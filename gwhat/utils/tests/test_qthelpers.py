@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © GWHAT Project Contributors
+# https://github.com/jnsebgosselin/gwhat
+#
+# This file is part of GWHAT (Ground-Water Hydrograph Analysis Toolbox).
+# Licensed under the terms of the GNU General Public License.
+
+# ---- Standard imports
+import os
+import os.path as osp
+
+# ---- Third party imports
+import pytest
+
+# ---- Local imports
+from gwhat.utils.qthelpers import FileSaver
+
+
+# ---- Pytest fixtures
+@pytest.fixture
+def file_saver(qtbot):
+    file_saver = FileSaver()
+    yield file_saver
+    file_saver.wait()
+
+
+# ---- Tests
+def test_file_saver(file_saver, qtbot, tmp_path):
+    """
+    Test that the file saver is saving files with the provided function
+    in a separate thread as expected.
+    """
+    fname = osp.join(str(tmp_path), 'test_file_saver.txt')
+
+    def save_func(fname):
+        with open(fname, 'w') as f:
+            f.write('test')
+
+    with qtbot.waitSignal(file_saver.sig_file_saved) as blocker:
+        file_saver.save(save_func, fname)
+    assert blocker.args == [fname]
+    with open(fname) as f:
+        assert f.read() == 'test'
+
+
+def test_file_saver_error(file_saver, qtbot, tmp_path):
+    """
+    Test that the file saver is signaling the errors raised by the provided
+    function and the outcome of the last save only.
+    """
+    fname1 = osp.join(str(tmp_path), 'test_file_saver_1.txt')
+    fname2 = osp.join(str(tmp_path), 'test_file_saver_2.txt')
+
+    def save_func(fname):
+        raise PermissionError(fname)
+
+    with qtbot.waitSignal(file_saver.sig_save_error) as blocker:
+        file_saver.save(save_func, fname1)
+        file_saver.save(save_func, fname2)
+    assert blocker.args[0] == fname2
+    assert isinstance(blocker.args[1], PermissionError)
+
+
+if __name__ == "__main__":
+    pytest.main(['-x', os.path.basename(__file__), '-v', '-rw'])
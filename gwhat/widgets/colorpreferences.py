@@ -28,11 +28,15 @@ class ColorPreferencesDialog(QDialog):
         self.setWindowTitle('Colors Palette Setup')
         self.setWindowFlags(
             self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+
+        # The colors manager is created only once and reused by the dialog,
+        # so that the colors file is read only when the dialog is shown.
+        self._colors_manager = ColorsManager()
         self.__initUI__()
 
     def __initUI__(self):
         # Setup the colors.
-        colors_manager = ColorsManager()
+        colors_manager = self._colors_manager
         colorGrid_widget = QWidget()
         self.colorGrid_layout = QGridLayout(colorGrid_widget)
         self._color_buttons = {}
@@ -49,7 +53,7 @@ class ColorPreferencesDialog(QDialog):
             self.colorGrid_layout.addWidget(btn, i, 1)
             self._color_buttons[key] = btn
         self.colorGrid_layout.setColumnStretch(0, 100)
-        self.load_colors()
+        self.update_color_buttons()
 
         # Settup the buttons.
         self.btn_apply = QPushButton('Apply')
@@ -77,19 +81,24 @@ class ColorPreferencesDialog(QDialog):
         main_layout.setSizeConstraint(main_layout.SetFixedSize)
 
     def load_colors(self):
-        colors_manager = ColorsManager()
+        """Load the colors from the colors file and update the buttons."""
+        self._colors_manager.load_colors()
+        self.update_color_buttons()
+
+    def update_color_buttons(self):
+        """Update the buttons with the colors of the colors manager."""
         for key, button in self._color_buttons.items():
-            button.setStyleSheet(
+            stylesheet = (
                 "background-color: rgb(%i,%i,%i)" %
-                tuple(colors_manager.RGB[key]))
+                tuple(self._colors_manager.RGB[key]))
+            # Setting a stylesheet forces Qt to polish the button again,
+            # even when the stylesheet did not change.
+            if button.styleSheet() != stylesheet:
+                button.setStyleSheet(stylesheet)
 
     def reset_defaults(self):
-        colors_manager = ColorsManager()
-        colors_manager.reset_defaults()
-        for key, button in self._color_buttons.items():
-            button.setStyleSheet(
-                "background-color: rgb(%i,%i,%i)" %
-                tuple(colors_manager.RGB[key]))
+        self._colors_manager.reset_defaults()
+        self.update_color_buttons()
 
     def pick_color(self):
         sender = self.sender()
@@ -103,7 +112,7 @@ class ColorPreferencesDialog(QDialog):
         self.close()
 
     def btn_apply_isClicked(self):
-        colors_manager = ColorsManager()
+        colors_manager = self._colors_manager
         for key, button in self._color_buttons.items():
             button_rgb = list(button.palette().base().color().getRgb()[:-1])
             colors_manager.RGB[key] = button_rgb
@@ -72,11 +72,12 @@ class FigureCanvas(QFrame):
         renderer.dpi = orig_ren_dpi
         mplfig.dpi = orig_fig_dpi
 
-        # Convert buffer to QPixmap :
+        # Convert buffer to QPixmap. The buffer is read directly in the RGBA
+        # byte order used by matplotlib, so that no intermediate copy of the
+        # image is needed to swap the red and blue channels.
 
-        self.img = QImage(imgbuf, imgwidth, imgheight, QImage.Format_ARGB32)
-        self.img = QImage.rgbSwapped(self.img)
-        self.img = QPixmap(self.img)
+        self.img = QPixmap.fromImage(QImage(
+            imgbuf, imgwidth, imgheight, QImage.Format_RGBA8888))
 
     def paintEvent(self, event):
         """Qt method override to paint a custom image on the Widget."""
@@ -241,7 +242,10 @@ class ImageViewer(QScrollArea):                           # ImageViewer #
     def load_mpl_figure(self, mplfig, view_dpi=150):
         self.imageCanvas.load_mpl_figure(mplfig, view_dpi)
         self.scale_image()
-        self.imageCanvas.repaint()
+        # The repaint is scheduled instead of being done right away, so that
+        # it is merged with the other paint events of the canvas, like the
+        # one posted by scale_image when the size of the figure changed.
+        self.imageCanvas.update()
 
     def reset_original_image(self):
         """Reset the image to its original size."""
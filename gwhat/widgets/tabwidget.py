@@ -7,9 +7,6 @@
 # Licensed under the terms of the GNU General Public License.
 # -----------------------------------------------------------------------------
 
-# ---- Standard library imports
-import copy
-
 # ---- Third party imports
 from PyQt5.QtCore import pyqtSignal as QSignal
 from PyQt5.QtCore import QUrl, QSize
@@ -123,7 +120,7 @@ class TabBar(QTabBar):
         self.sig_resized.emit()
 
     def storeIndex(self, index):
-        self.__oldIndex = copy.copy(self.__newIndex)
+        self.__oldIndex = self.__newIndex
         self.__newIndex = index
 
     def previousIndex(self):
@@ -22,18 +22,17 @@
 
 # ---- Imports: standard libraries
 
-import re
-from distutils.version import LooseVersion
+import operator
 
 
 # ---- Imports: third parties
 
+from packaging.version import InvalidVersion, Version
 from PyQt5.QtCore import QObject, Qt, QThread
 from PyQt5.QtCore import pyqtSlot as QSlot
 from PyQt5.QtCore import pyqtSignal as QSignal
 from PyQt5.QtGui import QCursor
 from PyQt5.QtWidgets import QApplication, QMessageBox
-import requests
 
 # ---- Imports: local
 
@@ -130,15 +129,23 @@ class WorkerUpdates(QObject):
 
     def start(self):
         """Main method of the WorkerUpdates worker."""
+        # We import requests here instead of at the top of the module
+        # because it is slow to import and only needed to check for updates.
+        import requests
+
         self.update_available = False
         self.latest_release = __version__
         self.error = None
         try:
-            page = requests.get(__releases_api__)
+            # Only the most recent releases are requested, since the
+            # releases are listed from the newest to the oldest.
+            page = requests.get(
+                __releases_api__, params={'per_page': 10}, timeout=(3, 5),
+                headers={'Accept': 'application/vnd.github.v3+json'})
             data = page.json()
-            releases = [item['tag_name'].replace('gwhat-', '')
+            releases = (item['tag_name'].replace('gwhat-', '')
                         for item in data
-                        if item['tag_name'].startswith("gwhat")]
+                        if item['tag_name'].startswith("gwhat"))
             result = check_update_available(__version__, releases)
             self.update_available, self.latest_release = result
         except requests.exceptions.HTTPError:
@@ -160,18 +167,21 @@ def check_update_available(version, releases):
     """
     Checks if there is an update available.
 
-    It takes as parameters the current version of GWHAT and a list of
+    It takes as parameters the current version of GWHAT and an iterable of
     valid cleaned releases in chronological order (what github api returns
     by default). Example: ['2.3.4', '2.3.3' ...]
 
+    The releases are only read up to the latest one that applies, which
+    is the latest stable release if the current version is stable. The
+    current version is returned as the latest release if none applies.
+
     Copyright (c) Spyder Project Contributors
     Licensed under the terms of the MIT License
     """
-    if is_stable_version(version):
-        # Remove non stable versions from the list
-        releases = [r for r in releases if is_stable_version(r)]
-
-    latest_release = releases[0]
+    stable_only = is_stable_version(version)
+    latest_release = next(
+        (r for r in releases if not stable_only or is_stable_version(r)),
+        version)
     if version.endswith('dev'):
         return (False, latest_release)
     else:
@@ -179,50 +189,37 @@ def check_update_available(version, releases):
                 latest_release)
 
 
+CMP_OPERATORS = {'>': operator.gt, '>=': operator.ge, '=': operator.eq,
+                 '<': operator.lt, '<=': operator.le}
+
+
 def check_version(actver, version, cmp_op):
     """
     Check version string of an active module against a required version.
 
-    If dev/prerelease tags result in TypeError for string-number comparison,
-    it is assumed that the dependency is satisfied. Users on dev branches are
-    responsible for keeping their own packages up to date.
+    If a version string cannot be parsed, it is assumed that the dependency
+    is satisfied. Users on dev branches are responsible for keeping their
+    own packages up to date.
 
     Copyright (C) 2013 The IPython Development Team
     Licensed under the terms of the BSD License
     """
     if isinstance(version, tuple):
         version = '.'.join([str(i) for i in version])
-
-    # Hacks needed so that LooseVersion understands that (for example)
-    # version = '3.0.0' is in fact bigger than actver = '3.0.0rc1'
-    if (is_stable_version(version) and not is_stable_version(actver) and
-            actver.startswith(version) and version != actver):
-        version = version + 'zz'
-    elif (is_stable_version(actver) and not is_stable_version(version) and
-            version.startswith(actver) and version != actver):
-        actver = actver + 'zz'
-
     try:
-        if cmp_op == '>':
-            return LooseVersion(actver) > LooseVersion(version)
-        elif cmp_op == '>=':
-            return LooseVersion(actver) >= LooseVersion(version)
-        elif cmp_op == '=':
-            return LooseVersion(actver) == LooseVersion(version)
-        elif cmp_op == '<':
-            return LooseVersion(actver) < LooseVersion(version)
-        elif cmp_op == '<=':
-            return LooseVersion(actver) <= LooseVersion(version)
-        else:
-            return False
-    except TypeError:
+        actver, version = Version(actver), Version(version)
+    except InvalidVersion:
         return True
+    try:
+        return CMP_OPERATORS[cmp_op](actver, version)
+    except KeyError:
+        return False
 
 
 def is_stable_version(version):
     """
-    Returns wheter this is a stable version or not. A stable version has no
-    letters in the final component, but only numbers.
+    Returns wheter this is a stable version or not. A stable version is not
+    a development or pre-release version.
 
     Stable version example: 1.2, 1.3.4, 1.0.5
     Not stable version: 1.2alpha, 1.3.4beta, 0.1.0rc1, 3.0.0dev
@@ -230,13 +227,11 @@ def is_stable_version(version):
     Copyright (c) 2017 Spyder Project Contributors
     Licensed under the terms of the MIT License
     """
-    if not isinstance(version, tuple):
-        version = version.split('.')
-    last_part = version[-1]
-
-    if not re.search('[a-zA-Z]', last_part):
-        return True
-    else:
+    if isinstance(version, tuple):
+        version = '.'.join([str(i) for i in version])
+    try:
+        return not Version(version).is_prerelease
+    except InvalidVersion:
         return False
 
 